@@ -0,0 +1,73 @@
+"""
+Local evaluation of questions that are nothing but an arithmetic expression
+("47 · 38 =", "7/2 ?"), so they are answered without waiting on the models.
+
+Kept free of browser and API imports so it can be imported and tested on its own.
+"""
+import ast
+import operator
+import re
+
+MAX_EXPRESSION_LENGTH = 200
+
+# Numbers, operators (ASCII and typographic), parentheses and whitespace,
+# optionally closed by '=' and/or '?'
+ARITHMETIC_RE = re.compile(r"(?P<expr>[\d\s+\-*/·×÷:().,]*\d[\d\s+\-*/·×÷:().,]*?)\s*(?P<marker>=?\s*\??)")
+# An operator with an operand on each side; a leading '-' alone is just a sign
+_BINARY_OPERATION_RE = re.compile(r"[\d)]\s*[+\-*/·×÷:]\s*[-+]?\s*[\d(]")
+# Digits joined only by '-' or ':' with no spaces read as dates, phone numbers,
+# scores or times ("2020-2021", "8-800-555-35-35", "12:30"), not as arithmetic
+_DIGIT_CHAIN_RE = re.compile(r"\d+(?:[-:]\d+)+")
+# "1,000" / "1.000" may be a thousands separator as well as a decimal point
+_AMBIGUOUS_THOUSANDS_RE = re.compile(r"(?<![\d.,])[1-9]\d{0,2}[.,]\d{3}(?![\d.,])")
+# Typographic operators and the decimal comma to Python syntax
+_ARITHMETIC_SYMBOLS = str.maketrans({"·": "*", "×": "*", "÷": "/", ":": "/", ",": "."})
+ARITHMETIC_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+def _eval_arithmetic(node):
+    """Evaluate a parsed expression made only of numbers and + - * /."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in ARITHMETIC_OPERATORS:
+        return ARITHMETIC_OPERATORS[type(node.op)](_eval_arithmetic(node.left), _eval_arithmetic(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in ARITHMETIC_OPERATORS:
+        return ARITHMETIC_OPERATORS[type(node.op)](_eval_arithmetic(node.operand))
+    raise ValueError("not plain arithmetic")
+
+def solve_arithmetic(question, decimal_comma=False):
+    """
+    Return the result of a pure arithmetic question as text, or None.
+
+    Args:
+        question (str): Question text
+        decimal_comma (bool): Write fractions with a comma ("3,5"), as Yaklass
+                              expects; a comma in the question implies it too
+
+    Returns:
+        str or None: None unless the question is unambiguous arithmetic
+    """
+    text = question.strip()
+    if len(text) > MAX_EXPRESSION_LENGTH:
+        return None
+    match = ARITHMETIC_RE.fullmatch(text)
+    if not match or not _BINARY_OPERATION_RE.search(match["expr"]):
+        return None
+    expr = match["expr"].strip()
+    if not match["marker"].strip() and _DIGIT_CHAIN_RE.fullmatch(expr):
+        return None
+    if _AMBIGUOUS_THOUSANDS_RE.search(expr):
+        return None
+    decimal_comma = decimal_comma or "," in expr
+    try:
+        value = round(_eval_arithmetic(ast.parse(expr.translate(_ARITHMETIC_SYMBOLS), mode="eval").body), 6)
+        result = str(int(value)) if value == int(value) else f"{value:f}".rstrip("0")
+    except (SyntaxError, ValueError, ZeroDivisionError, OverflowError, RecursionError, MemoryError):
+        return None
+    return result.replace(".", ",") if decimal_comma else result
@@ -10,7 +10,7 @@ Features:
   - Dynamic model discovery (tests each model for validity)
   - Answer extraction and cleaning (removes citations, symbols)
   - Automatic submission and navigation
-  - Fully recursive batch solving (loop through entire test)
+  - Batch solving (loops through the entire test)
   - Smart answer field detection (text input, select, radio, checkbox)
   - JSON logging with timestamps
   - Colorized console output with progress tracking
@@ -24,27 +24,43 @@ Setup:
 Author: Dye
 """
 import threading
+import queue
 import time
 import sys
 import random
+import subprocess
 import keyboard
 import pyperclip
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from openai import OpenAI
+from selenium.webdriver.support.select import Select
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from openai import OpenAI, DefaultHttpxClient
 from colorama import Fore, Style, init
 from groq import Groq
 import os
 import json
+import hashlib
+import importlib.util
 import math
+import re
+from urllib.parse import urlparse
 from datetime import datetime
 from pathlib import Path
+from functools import lru_cache
+from itertools import combinations
 import concurrent.futures
-from selenium.common.exceptions import StaleElementReferenceException, WebDriverException, NoSuchElementException
+from collections import Counter, deque
+import httpx
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException, NoSuchElementException, TimeoutException
 from dotenv import load_dotenv
+from arithmetic import solve_arithmetic
 
-sys.stdout.reconfigure(encoding='utf-8')
+# Line-buffered so progress shows up while the bot waits on models and pages
+sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
 init(autoreset=True)
 
 # ==================== ENV LOADER & VALIDATOR ====================
@@ -104,17 +120,32 @@ if not validated:
 # ==================== CONFIGURATION ====================
 
 HOTKEY = "F8"
-CHROME_DEBUG_PORT = "127.0.0.1:9222"
+CHROME_DEBUG_PORT = os.getenv("CHROME_DEBUG_ADDRESS", "127.0.0.1:9222")
 TYPING_MIN_DELAY = 0.01
 TYPING_MAX_DELAY = 0.03
+HUMAN_TYPING_ENABLED = os.getenv("HUMAN_TYPING", "1") in ("1", "true", "True")
+TYPING_CHUNK_SIZE = 6  # characters sent per send_keys call when typing like a human
 PAGE_LOAD_DELAY = 0.5
 SUBMIT_WAIT_TIME = 2
 NAVIGATION_WAIT_TIME = 1
 NEXT_PAGE_WAIT_TIME = 2
+# How long after the submit click the next button may take to appear
+NEXT_BUTTON_WAIT_TIME = SUBMIT_WAIT_TIME + NAVIGATION_WAIT_TIME
+SELECTION_WAIT_TIMEOUT = 2
+SELECTION_POLL_INTERVAL = 0.05
+BUTTON_POLL_INTERVAL = 0.25
 MAX_ANSWER_EXTRACT_WORDS = 5
+# Output budget per answer. Only the first MAX_ANSWER_EXTRACT_WORDS words are
+# kept, so plain models get a short cap; reasoning models write a <think>
+# block first and keep the larger one
+ANSWER_MAX_TOKENS = 32
+REASONING_ANSWER_MAX_TOKENS = 100
+REASONING_MODEL_MARKERS = ("reasoning", "gpt-oss", "deepseek-r1", "qwq", "qwen3")
 MAX_QUESTION_PREVIEW_LENGTH = 60
 MAX_LOGGED_CONTENT_LENGTH = 500
 MAX_ERROR_MSG_LENGTH = 80
+ERROR_LOG_SIZE = 200
+ANSWER_SIMILARITY_THRESHOLD = 0.8  # near-identical answers support each other in the vote
 
 # configuration
 REQUIRED_RATIO = float(os.getenv("REQUIRED_RATIO", "0.6"))
@@ -126,23 +157,100 @@ MAX_QUERY_RETRIES = 2
 INITIAL_BACKOFF = 0.3
 MAX_BACKOFF = 0.9
 BACKOFF_MULTIPLIER = 1.5
+MODEL_PROBE_TIMEOUT = 15
+WARM_UP_TIMEOUT = 3  # warm-up requests only open connections; never retried
+WARM_UP_WORKERS = 4
+MODELS_CACHE_TTL = int(os.getenv("MODELS_CACHE_TTL", "86400"))  # seconds
+REVALIDATE_MODELS = "--revalidate" in sys.argv or os.getenv("REVALIDATE", "0") in ("1", "true", "True")
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", str(7 * 86400)))  # seconds, 0 disables
+ANSWER_CACHE_SAVE_EVERY = 5  # new answers between answer cache writes
+
+LOG_DIR = Path("logs")
+LOG_DIR.mkdir(exist_ok=True)
+MODELS_CACHE_FILE = LOG_DIR / "models_cache.json"
+ANSWER_CACHE_FILE = LOG_DIR / "answer_cache.json"
+SUCCESS_LOG_FILE = LOG_DIR / "success.jsonl"
 
 # Platform detection
 CURRENT_PLATFORM = None  # Will be 'yaklass' or 'google_forms'
+_platform_cache = {}  # host -> platform, so detection runs once per site rather than per page
+
+# Large keep-alive pools so parallel queries reuse connections between questions.
+# httpx drops idle connections after 5s by default, shorter than a typical
+# question, so keep them long enough to survive until the next one.
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+# HTTP/2 multiplexes the parallel model queries over one connection per
+# provider; httpx needs the optional h2 package for it (pip install httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+perplexity_client = OpenAI(
+    api_key=pplx_key,
+    base_url="https://api.perplexity.ai",
+    http_client=DefaultHttpxClient(limits=HTTP_POOL_LIMITS, http2=HTTP2_ENABLED)
+)
+groq_client = Groq(api_key=groq_key, http_client=DefaultHttpxClient(limits=HTTP_POOL_LIMITS, http2=HTTP2_ENABLED))
+
+# ==================== MODEL CACHE ====================
+
+def api_keys_fingerprint():
+    """Short hash of the configured API keys; the keys themselves never hit the disk."""
+    return hashlib.sha256(f"{pplx_key}\n{groq_key}".encode('utf-8')).hexdigest()[:16]
+
+def load_models_cache():
+    """
+    Return cached model data if the cache file is younger than MODELS_CACHE_TTL
+    and was written for the same API keys, else None.
+    """
+    if REVALIDATE_MODELS:
+        return None
+    try:
+        with open(MODELS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if time.time() - cache.get("ts", 0) < MODELS_CACHE_TTL and cache.get("keys") == api_keys_fingerprint():
+            return cache
+    except (OSError, ValueError):
+        pass
+    return None
 
-perplexity_client = OpenAI(api_key=pplx_key, base_url="https://api.perplexity.ai")
-groq_client = Groq(api_key=groq_key)
+def save_models_cache(working_models, groq_models):
+    """Persist the validated model list so the next run can skip discovery."""
+    try:
+        with open(MODELS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                "ts": time.time(),
+                "keys": api_keys_fingerprint(),
+                "models": working_models,
+                "groq_models": groq_models,
+            }, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"{Fore.YELLOW}[!] Could not save model cache: {str(e)[:60]}")
+
+_GROQ_MODEL_IDS = None
+
+# Groq chat models kept even though their id doesn't mention "text"
+_KNOWN_TEXT_MODELS = frozenset({
+    'mixtral-8x7b-32768', 'llama-3.1-70b-versatile', 'llama-3.1-8b-instant',
+    'llama-3.3-70b-versatile', 'llama-2-70b-4096', 'gemma-7b-it',
+})
+
+# Groq model ids for speech-to-text / text-to-speech endpoints
+_NON_CHAT_MODEL_MARKERS = ("whisper", "tts")
+
+def fetch_groq_model_ids():
+    """Fetch every model id from the Groq API once per run; later calls reuse the list."""
+    global _GROQ_MODEL_IDS
+    if _GROQ_MODEL_IDS is None:
+        _GROQ_MODEL_IDS = [m.id for m in groq_client.models.list().data]
+    return _GROQ_MODEL_IDS
 
 # Fetch available models from Groq
 def fetch_groq_models():
     """Fetch all available text-to-text models from Groq API."""
+    cache = load_models_cache()
+    if cache and cache.get("groq_models"):
+        return cache["groq_models"]
     try:
-        models = groq_client.models.list()
-        model_names = [m.id for m in models.data if 'text' in m.id.lower() or m.id in [
-            'mixtral-8x7b-32768', 'llama-3.1-70b-versatile', 'llama-3.1-8b-instant',
-            'llama-3.3-70b-versatile', 'llama-2-70b-4096', 'gemma-7b-it'
-        ]]
-        return sorted(list(set(model_names)))
+        return sorted({m for m in fetch_groq_model_ids() if 'text' in m.lower() or m in _KNOWN_TEXT_MODELS})
     except Exception as e:
         print(f"{Fore.YELLOW}[!] Could not fetch Groq models: {str(e)[:60]}")
         # Fallback to manual list
@@ -171,9 +279,9 @@ for model in GROQ_MODELS:
 
 WORKING_MODELS = list(MODELS)  # Will be updated after API check
 
-error_log = []
-LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
+# Most recent errors of the current question; bounded so a question that keeps
+# retrying cannot grow it without limit
+error_log = deque(maxlen=ERROR_LOG_SIZE)
 
 # Statistics tracking
 stats = {
@@ -183,12 +291,155 @@ stats = {
     "start_time": None,
 }
 
+# ==================== ANSWER CACHE ====================
+
+def load_answer_cache():
+    """Load answers chosen in earlier runs, dropping entries older than ANSWER_CACHE_TTL."""
+    try:
+        with open(ANSWER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        now = time.time()
+        return {key: entry for key, entry in cache.items() if now - entry.get("ts", 0) < ANSWER_CACHE_TTL}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+_answer_cache = load_answer_cache() if ANSWER_CACHE_TTL > 0 else {}
+
+def answer_cache_key(question):
+    """Hash of the whitespace/case-normalized question and the current model set."""
+    normalized = " ".join(question.lower().split())
+    payload = json.dumps([sorted(f"{p}:{m}" for p, m in WORKING_MODELS), normalized], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def lookup_cached_answer(question):
+    """Return the answer chosen for this question before, or None."""
+    if ANSWER_CACHE_TTL <= 0:
+        return None
+    entry = _answer_cache.get(answer_cache_key(question))
+    if entry and time.time() - entry["ts"] < ANSWER_CACHE_TTL:
+        return entry["answer"]
+    return None
+
+# Changes made to the cache so far, and how many of them are on disk. Only the
+# solve loop counts changes and only a successful write advances the saved mark,
+# so a failed write leaves its changes counted as unsaved.
+_answer_cache_changes = 0
+_answer_cache_saved_changes = 0
+_answer_cache_save = None
+
+# One writer thread keeps periodic saves off the solve loop and in order
+_answer_cache_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="answer-cache")
+
+def answer_cache_unsaved():
+    return _answer_cache_changes - _answer_cache_saved_changes
+
+def write_answer_cache(snapshot, changes):
+    """Write a cache snapshot that includes the first `changes` changes."""
+    global _answer_cache_saved_changes
+    try:
+        with open(ANSWER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        _answer_cache_saved_changes = max(_answer_cache_saved_changes, changes)
+    except OSError as e:
+        print(f"{Fore.YELLOW}[!] Could not save answer cache: {str(e)[:60]}")
+
+def save_answer_cache(background=False):
+    """Write the answer cache to disk if it has entries not saved yet."""
+    global _answer_cache_save
+    if not answer_cache_unsaved():
+        return
+    if background and _answer_cache_save and not _answer_cache_save.done():
+        # The write in flight is retried on the next trigger if it fails
+        return
+    # Snapshot on this thread so the writer never sees the dict mid-update
+    snapshot = dict(_answer_cache)
+    if background:
+        _answer_cache_save = _answer_cache_writer.submit(write_answer_cache, snapshot, _answer_cache_changes)
+    else:
+        write_answer_cache(snapshot, _answer_cache_changes)
+
+def evict_cached_answer(question):
+    """Forget a cached answer that turned out not to fit the question."""
+    global _answer_cache_changes
+    if _answer_cache.pop(answer_cache_key(question), None) is not None:
+        _answer_cache_changes += 1
+
+def store_cached_answer(question, answer):
+    """
+    Remember a consensus answer; the file is rewritten every
+    ANSWER_CACHE_SAVE_EVERY answers and at exit. Fallback picks are never
+    stored, so a re-run asks the models again instead of repeating them.
+    """
+    global _answer_cache_changes
+    if ANSWER_CACHE_TTL <= 0 or not answer:
+        return
+    _answer_cache[answer_cache_key(question)] = {"answer": answer, "ts": time.time()}
+    _answer_cache_changes += 1
+    if answer_cache_unsaved() >= ANSWER_CACHE_SAVE_EVERY:
+        save_answer_cache(background=True)
+
+# ==================== SUCCESS LOG ====================
+
+# Records are appended to one JSONL file by a background thread, so the
+# solve loop never blocks on disk I/O
+_success_log_queue = queue.Queue()
+
+def success_log_writer():
+    try:
+        with open(SUCCESS_LOG_FILE, 'a', encoding='utf-8') as f:
+            while True:
+                record = _success_log_queue.get()
+                if record is None:
+                    break
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if _success_log_queue.empty():
+                    f.flush()
+    except OSError as e:
+        print(f"{Fore.YELLOW}[!] Logging failed: {str(e)[:60]}")
+
+_success_log_thread = threading.Thread(target=success_log_writer, name="success-log", daemon=True)
+_success_log_thread.start()
+
+def log_success(record):
+    """Queue one solved-question record for the log writer."""
+    _success_log_queue.put(record)
+
+def close_success_log():
+    """Write out queued records before exit."""
+    _success_log_queue.put(None)
+    _success_log_thread.join(timeout=2)
+
 # ==================== MODEL DISCOVERY & VALIDATION ====================
 
+def probe_model(client, model):
+    """
+    Check that a provider accepts the model by reading only the first streamed chunk.
+    Auth and unknown-model errors are raised before any token arrives. SDK retries
+    are off: a model that fails once is dropped rather than holding up startup.
+    """
+    stream = client.with_options(max_retries=0, timeout=MODEL_PROBE_TIMEOUT).chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": "hi"}],
+        max_tokens=1,
+        stream=True
+    )
+    try:
+        next(iter(stream), None)
+    finally:
+        stream.close()
+
 def discover_and_validate_models():
     """Discover all available models and test which ones work. Keep only working models."""
     global WORKING_MODELS
     
+    cache = load_models_cache()
+    if cache and len(cache.get("models", [])) >= 2:
+        WORKING_MODELS = [tuple(m) for m in cache["models"]]
+        age_hours = (time.time() - cache["ts"]) / 3600
+        print(f"\n{Fore.GREEN}[+] Loaded {len(WORKING_MODELS)} working models from cache ({age_hours:.1f}h old)")
+        print(f"{Fore.CYAN}    Run with --revalidate or set REVALIDATE=1 to test models again")
+        return WORKING_MODELS
+    
     print(f"\n{Fore.CYAN}[*] Discovering and validating all available models...")
     
     # Get all candidate models
@@ -201,8 +452,8 @@ def discover_and_validate_models():
     
     groq_candidates = []
     try:
-        models = groq_client.models.list()
-        groq_candidates = [m.id for m in models.data]
+        # Speech models can never answer a chat request; don't spend probes on them
+        groq_candidates = [m for m in fetch_groq_model_ids() if not any(marker in m for marker in _NON_CHAT_MODEL_MARKERS)]
         print(f"{Fore.CYAN}    Fetched {len(groq_candidates)} Groq models from API")
     except Exception as e:
         print(f"{Fore.YELLOW}    [!] Could not fetch Groq model list: {str(e)[:60]}")
@@ -215,41 +466,39 @@ def discover_and_validate_models():
             "mixtral-8x7b-32768",
         ]
     
-    working_models = []
-    
-    # Test Perplexity models
-    print(f"\n{Fore.CYAN}[*] Testing Perplexity models ({len(perplexity_candidates)} total)...")
-    for model in perplexity_candidates:
-        try:
-            response = perplexity_client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": "test"}],
-                temperature=0.3,
-                max_tokens=10
-            )
-            print(f"{Fore.GREEN}    ✓ {model}")
-            working_models.append(("perplexity", model))
-        except Exception as e:
-            print(f"{Fore.RED}    ✗ {model}: {str(e)[:50]}")
-    
-    # Test Groq models
-    print(f"\n{Fore.CYAN}[*] Testing Groq models ({len(groq_candidates)} total)...")
-    groq_working_count = 0
-    for model in groq_candidates:
-        try:
-            response = groq_client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": "test"}],
-                temperature=0.3,
-                max_tokens=10
-            )
-            print(f"{Fore.GREEN}    ✓ {model}")
-            working_models.append(("groq", model))
-            groq_working_count += 1
-        except Exception:
-            pass  # Silently skip non-working models
+    # Probe every candidate at once - each test call is an independent HTTP request
+    candidates = [("perplexity", model, perplexity_client) for model in perplexity_candidates]
+    candidates += [("groq", model, groq_client) for model in groq_candidates]
     
-    if groq_working_count == 0:
+    print(f"\n{Fore.CYAN}[*] Testing {len(candidates)} models in parallel "
+          f"({len(perplexity_candidates)} Perplexity, {len(groq_candidates)} Groq)...")
+    passed = set()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(candidates)))
+    try:
+        futures = {}
+        for provider, model, client in candidates:
+            future = executor.submit(probe_model, client, model)
+            futures[future] = (provider, model)
+        
+        for future in concurrent.futures.as_completed(futures, timeout=MODEL_PROBE_TIMEOUT):
+            provider, model = futures[future]
+            try:
+                future.result()
+                print(f"{Fore.GREEN}    ✓ {provider.upper()}: {model}")
+                passed.add((provider, model))
+            except Exception as e:
+                if provider == "perplexity":
+                    print(f"{Fore.RED}    ✗ {model}: {str(e)[:50]}")
+                # Silently skip non-working Groq models
+    except concurrent.futures.TimeoutError:
+        print(f"{Fore.YELLOW}    [!] Some models did not respond within {MODEL_PROBE_TIMEOUT}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Keep the original candidate order (Perplexity first) regardless of completion order
+    working_models = [(provider, model) for provider, model, _ in candidates if (provider, model) in passed]
+    
+    if not any(provider == "groq" for provider, _ in working_models):
         print(f"{Fore.YELLOW}    [!] No working Groq models found")
     
     if len(working_models) < 2:
@@ -262,20 +511,51 @@ def discover_and_validate_models():
         print(f"    {Fore.GREEN}✓ {provider.upper()}: {model}")
     
     WORKING_MODELS = working_models
+    save_models_cache(working_models, GROQ_MODELS)
     return working_models
 
 print(f"{Fore.CYAN}[*] Connecting to Chrome Debugger...")
 chrome_options = Options()
-chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
+chrome_options.add_experimental_option("debuggerAddress", CHROME_DEBUG_PORT)
 
-try:
-    driver = webdriver.Chrome(options=chrome_options)
-    print(f"{Fore.GREEN}[+] Connected successfully! Bot is ready.")
-except Exception as e:
-    print(f"{Fore.RED}[!] Could not connect to Chrome. Make sure 'Chrome Debug' is open.")
-    print(f"{Fore.YELLOW}Details: {e}")
-    input("Press Enter to exit...")
-    exit()
+def connect_driver():
+    """Attach a new chromedriver session to the debug Chrome (chromedriver logs discarded)."""
+    return webdriver.Chrome(service=Service(log_output=subprocess.DEVNULL), options=chrome_options)
+
+def get_driver():
+    """Return the current driver, reconnecting only if its session has died."""
+    global driver
+    try:
+        driver.current_url
+    except WebDriverException:
+        print(f"{Fore.YELLOW}[!] Lost connection to Chrome, reconnecting...")
+        try:
+            driver.service.stop()
+        except Exception:
+            pass
+        driver = connect_driver()
+        invalidate_platform_cache()
+        print(f"{Fore.GREEN}[+] Reconnected to Chrome")
+    return driver
+
+# Spawning chromedriver and attaching takes a while; do it in the background
+# while the models are validated and only wait for it once startup is done
+driver = None
+_connect_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="connect")
+_driver_future = _connect_executor.submit(connect_driver)
+_connect_executor.shutdown(wait=False)
+
+def finish_connecting_driver():
+    """Wait for the startup connection to Chrome, exiting if it failed."""
+    global driver
+    try:
+        driver = _driver_future.result()
+        print(f"{Fore.GREEN}[+] Connected successfully! Bot is ready.")
+    except Exception as e:
+        print(f"{Fore.RED}[!] Could not connect to Chrome. Make sure 'Chrome Debug' is open.")
+        print(f"{Fore.YELLOW}Details: {e}")
+        input("Press Enter to exit...")
+        exit()
 
 # ==================== DIAGNOSTICS & INTERACTIVE MODE ====================
 
@@ -427,7 +707,11 @@ def interactive_element_selector():
     except Exception as e:
         print(f"{Fore.RED}[!] Interactive selector error: {str(e)[:60]}")
 
+@lru_cache(maxsize=4096)
 def normalize_answer(text):
+    """Lowercase and collapse whitespace. Cached: the same strings are compared many times per question."""
+    if not isinstance(text, str):
+        return ""
     return " ".join(text.lower().strip().split())
 
 # ==================== QUESTION TYPE VERIFICATION ====================
@@ -466,7 +750,7 @@ def verify_question_type_with_user(question_text, field_type, options):
     try:
         choice = input(f"{Fore.CYAN}    Choice (1-4): ").strip()
         return choice == "1"  # Return True if user confirmed, False if they want to change
-    except:
+    except EOFError:
         return True  # Default to confirmed
 
 def find_question_div_interactive():
@@ -498,11 +782,232 @@ def find_question_div_interactive():
 
 # ==================== PLATFORM DETECTION & CALIBRATION ====================
 
+# Selector lists, built once. Mixed lists are pre-tagged with their By strategy.
+def _by_selector(selector):
+    return (By.XPATH if selector.startswith("//") else By.CSS_SELECTOR, selector)
+
+YAKLASS_QUESTION_SELECTORS = (
+    "div#taskhtml",
+    "div.gxst-ibody",
+    "div.task-body",
+)
+YAKLASS_ANSWER_SELECTORS = (
+    "input.gxs-answer-text-short",
+    "input.gxs-answer-input",
+    "input[type='text'].answer",
+    "textarea.gxs-answer",
+    "input[placeholder*='ответ']",
+    "textarea[placeholder*='ответ']",
+    ".answer-input input",
+    ".answer-input textarea",
+)
+
+GOOGLE_FORMS_QUESTION_CONTAINER_SELECTORS = (
+    ("div[data-item-id]", "data-item-id"),
+    ("div[role='heading']", "role='heading'"),
+    ("div[class*='question']", "class*='question'"),
+    ("div[class*='item']", "class*='item'"),
+    ("div[class*='prompt']", "class*='prompt'"),
+)
+
+GOOGLE_FORMS_TEXT_SELECTORS = (
+    "input[type='text'][aria-label]",
+    "textarea[aria-label]",
+    "input[type='text'][aria-describedby]",
+    "textarea[aria-describedby]",
+    "input[type='text'][class*='input']",
+    "textarea[class*='textarea']",
+    "input[type='email']",
+    "input[type='url']",
+    "input[type='number']",
+    "div[role='textbox'][contenteditable='true']",
+    "input[type='text']:not([aria-hidden])",
+    "textarea:not([aria-hidden])",
+)
+
+GOOGLE_FORMS_RADIO_SELECTORS = (
+    # Primary: Find by data-item-id (question container) then radio inputs within
+    ("div[data-item-id] input[type='radio']", "data-item-id input[type='radio']"),
+    # Secondary: Role-based
+    ("div[role='radio']", "role='radio'"),
+    # Tertiary: Find option containers with radio
+    ("div[class*='option'] input[type='radio']", "option input[type='radio']"),
+    # Fallback: Just radio inputs
+    ("input[type='radio']", "input[type='radio']"),
+)
+
+GOOGLE_FORMS_RADIO_DESCRIPTIONS = dict(GOOGLE_FORMS_RADIO_SELECTORS)
+
+GOOGLE_FORMS_CHECKBOX_SELECTORS = (
+    "input[type='checkbox']",
+    "div[role='checkbox']",
+    "div[class*='checkbox'][role='button']",
+    "label[class*='checkbox']",
+    "div[class*='option'][class*='checkbox']",
+)
+
+GOOGLE_FORMS_SELECT_SELECTORS = (
+    "select[aria-label]",
+    "select[aria-describedby]",
+    "div[role='listbox']",
+    "div[class*='dropdown']",
+    "select",
+)
+
+# Answer field cascades in detection order: (field type, selectors, minimum visible matches)
+GOOGLE_FORMS_FIELD_GROUPS = (
+    ("text", GOOGLE_FORMS_TEXT_SELECTORS, 1),
+    ("radio", tuple(GOOGLE_FORMS_RADIO_DESCRIPTIONS), 2),
+    ("checkbox", GOOGLE_FORMS_CHECKBOX_SELECTORS, 2),
+    ("select", GOOGLE_FORMS_SELECT_SELECTORS, 1),
+)
+
+FIELD_TYPE_LABELS = {
+    "text": "TEXT INPUT",
+    "radio": "RADIO BUTTONS",
+    "checkbox": "CHECKBOXES",
+    "select": "SELECT DROPDOWN",
+}
+
+GOOGLE_FORMS_QUESTION_TEXT_SELECTORS = (
+    "div[role='heading']",
+    "div[class*='prompt']",
+    "span[class*='title']",
+    "div[class*='text']",
+    "span",
+)
+SUBMIT_BUTTON_SELECTORS = {
+    "google_forms": tuple(map(_by_selector, (
+        "button[aria-label*='Submit']",
+        "button[aria-label*='submit']",
+        "div[role='button'][aria-label*='Submit']",
+        "//button[contains(text(), 'Submit')]",
+        "//button[contains(text(), 'Next')]",
+        "//button[contains(text(), 'next')]",
+    ))),
+    "yaklass": tuple(map(_by_selector, (
+        "//button[contains(text(), 'Ответить!')]",
+        "//button[contains(text(), 'Ответить')]",
+        "//button[contains(text(), 'ответить')]",
+        "//button[contains(text(), 'сохранить')]",
+    ))),
+}
+NEXT_BUTTON_SELECTORS = {
+    "google_forms": tuple(map(_by_selector, (
+        "button[aria-label*='Next']",
+        "//button[contains(text(), 'Next')]",
+        "div[role='button'][aria-label*='Next']",
+        "a[aria-label*='Next']",
+    ))),
+    # Specific CSS classes first: they resolve natively, where each text
+    # XPath walks the document. The broad href match stays a last resort.
+    "yaklass": tuple(map(_by_selector, (
+        "a.next-question",
+        ".pagination a.next",
+        "//button[contains(text(), 'Дальше')]",
+        "//a[contains(text(), 'Дальше')]",
+        "//button[contains(text(), 'дальше')]",
+        "//a[contains(text(), 'дальше')]",
+        "a[href*='next']",
+    ))),
+}
+# Button-text keywords as one case-insensitive alternation each, matched in-page
+SUBMIT_BUTTON_KEYWORDS = "|".join(map(re.escape, ("ответ", "сохран", "submit", "next", "дальше")))
+NEXT_BUTTON_KEYWORDS = "|".join(map(re.escape, ("дальше", "next")))
+
+# ==================== QUESTION EXTRACTION ====================
+
+# arguments: [question element, selectors in priority order]. First descendant
+# text longer than 5 chars not starting with the required-field '*', else the
+# whole element's text.
+QUESTION_TEXT_JS = """
+const [root, selectors] = arguments;
+for (const selector of selectors) {
+    for (const el of root.querySelectorAll(selector)) {
+        const text = (el.innerText || '').trim();
+        if (text.length > 5 && !text.slice(0, 3).includes('*')) return text;
+    }
+}
+return (root.innerText || '').trim();
+"""
+
+# Rendered-visibility test shared by the in-page helpers. checkVisibility() skips
+# the layout walk offsetParent forces and also catches visibility:hidden. The
+# fallback uses client rects, since offsetParent is null for position:fixed
+# elements such as sticky submit bars.
+IS_VISIBLE_JS = """
+function isVisible(el) {
+    if (el.checkVisibility) return el.checkVisibility({visibilityProperty: true});
+    return el.getClientRects().length > 0;
+}
+"""
+
+# Label text for a radio/checkbox input. Strategies in order of reliability:
+# parent <label>, aria-label, following sibling <span>, parent div text, value.
+OPTION_LABEL_JS = IS_VISIBLE_JS + """
+function optionLabel(el) {
+    const label = el.closest('label');
+    if (label && label.innerText.trim()) return label.innerText.trim();
+    const aria = el.getAttribute('aria-label');
+    if (aria) return aria.trim();
+    let sibling = el.nextElementSibling;
+    while (sibling && sibling.tagName !== 'SPAN') sibling = sibling.nextElementSibling;
+    if (sibling && sibling.innerText.trim()) return sibling.innerText.trim();
+    const parent = el.parentElement && el.parentElement.closest('div');
+    if (parent && parent.innerText.trim()) return parent.innerText.trim();
+    return (el.value || '').trim();
+}
+function describeOption(el) {
+    return {element: el, visible: isVisible(el), label: optionLabel(el)};
+}
+"""
+
+# Scores every visible div that holds question text and input fields together
+# (score = text length + 20 per input) and returns the highest scoring one,
+# with radio/checkbox labels already resolved.
+EXTRACT_QUESTION_JS = OPTION_LABEL_JS + """
+// Only divs that contain a field can qualify, so collect the ancestors of fields
+// instead of walking every div on the page
+const divs = new Set();
+for (const field of document.querySelectorAll('input, textarea, select')) {
+    for (let el = field.parentElement; el; el = el.parentElement) {
+        if (el.tagName !== 'DIV') continue;
+        if (divs.has(el)) break;  // its ancestors are already collected
+        divs.add(el);
+    }
+}
+const FIELDS = "input[type='radio'], input[type='checkbox'], input[type='text'], textarea, select";
+// Keep only the running best; per-type field lists are built for the winner alone
+let best = null;
+for (const div of divs) {
+    if (!isVisible(div)) continue;
+    const text = (div.innerText || '').trim();
+    if (text.length < 15 || text.length > 500) continue;
+    const total = div.querySelectorAll(FIELDS).length;
+    if (total === 0) continue;
+    const score = text.length + total * 20;
+    // Ties go to the div that comes first in the document
+    const earlier = best !== null && score === best.score
+        && (div.compareDocumentPosition(best.element) & Node.DOCUMENT_POSITION_FOLLOWING);
+    if (best === null || score > best.score || earlier) {
+        best = {element: div, text: text, total_inputs: total, score: score};
+    }
+}
+if (best !== null) {
+    const div = best.element;
+    best.radios = Array.from(div.querySelectorAll("input[type='radio']")).map(describeOption);
+    best.checkboxes = Array.from(div.querySelectorAll("input[type='checkbox']")).map(describeOption);
+    best.text_inputs = Array.from(div.querySelectorAll("input[type='text'], textarea"));
+    best.selects = Array.from(div.querySelectorAll('select'));
+}
+return {best: best, scanned: divs.size};
+"""
+
 def extract_question_structure(use_interactive=False):
     """
     PRECISION EXTRACTION: Finds exact question + options in one operation.
     Algorithm:
-    1. Scan ALL divs for ones with text + input fields together
+    1. Scan ALL divs (in-page, single JS call) for ones with text + input fields together
     2. Score by self-containment (question text + options nearby)
     3. Return the best match with all metadata needed
     4. Optionally allow user to click elements if auto-detection fails
@@ -510,58 +1015,15 @@ def extract_question_structure(use_interactive=False):
     print(f"\n{Fore.CYAN}[🎯] EXTRACTING QUESTION STRUCTURE (PRECISION MODE)...")
     
     try:
-        all_divs = driver.find_elements(By.TAG_NAME, "div")
-        print(f"    Scanning {len(all_divs)} divs...")
-        
-        candidates = []
-        
-        # Find all divs that are complete question containers
-        for div in all_divs:
-            try:
-                if not div.is_displayed():
-                    continue
-                
-                # Get div content
-                div_text = div.text.strip()
-                if not div_text or len(div_text) < 15 or len(div_text) > 500:
-                    continue
-                
-                # Check for input elements INSIDE this div
-                radios = div.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                checkboxes = div.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-                text_inputs = div.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea")
-                selects = div.find_elements(By.CSS_SELECTOR, "select")
-                
-                total_inputs = len(radios) + len(checkboxes) + len(text_inputs) + len(selects)
-                
-                # Only consider divs with at least 1 input
-                if total_inputs == 0:
-                    continue
-                
-                # Calculate score (prefer divs with more inputs = more self-contained)
-                score = len(div_text) + (total_inputs * 20)
-                
-                candidates.append({
-                    "element": div,
-                    "text": div_text,
-                    "radios": radios,
-                    "checkboxes": checkboxes,
-                    "text_inputs": text_inputs,
-                    "selects": selects,
-                    "total_inputs": total_inputs,
-                    "score": score
-                })
-            except:
-                pass
+        # Whole scan runs in-page: one round-trip instead of several per div
+        scan = driver.execute_script(EXTRACT_QUESTION_JS)
+        print(f"    Scanned {scan['scanned']} divs")
         
-        if not candidates:
+        best = scan["best"]
+        if not best:
             print(f"    {Fore.RED}✗ No question containers found")
             return None
         
-        # Sort by score - highest score = most self-contained
-        candidates.sort(key=lambda x: x["score"], reverse=True)
-        best = candidates[0]
-        
         print(f"    {Fore.GREEN}✓ Found best container (score: {best['score']})")
         print(f"    Text: {best['text'][:100]}...")
         print(f"    Inputs: {best['total_inputs']} field(s)")
@@ -582,19 +1044,12 @@ def extract_question_structure(use_interactive=False):
             print(f"    {Fore.GREEN}✓ Field: RADIO ({len(best['radios'])} options)")
             
             for radio in best["radios"]:
-                try:
-                    if not radio.is_displayed():
-                        continue
-                    
-                    label_text = _extract_option_label(radio)
-                    if label_text:
-                        result["options"].append({
-                            "text": label_text,
-                            "element": radio,
-                            "type": "radio"
-                        })
-                except:
-                    pass
+                if radio["visible"] and radio["label"]:
+                    result["options"].append({
+                        "text": radio["label"],
+                        "element": radio["element"],
+                        "type": "radio"
+                    })
         
         elif len(best["checkboxes"]) > 0:
             result["field_type"] = "checkbox"
@@ -602,19 +1057,12 @@ def extract_question_structure(use_interactive=False):
             print(f"    {Fore.GREEN}✓ Field: CHECKBOX ({len(best['checkboxes'])} options)")
             
             for checkbox in best["checkboxes"]:
-                try:
-                    if not checkbox.is_displayed():
-                        continue
-                    
-                    label_text = _extract_option_label(checkbox)
-                    if label_text:
-                        result["options"].append({
-                            "text": label_text,
-                            "element": checkbox,
-                            "type": "checkbox"
-                        })
-                except:
-                    pass
+                if checkbox["visible"] and checkbox["label"]:
+                    result["options"].append({
+                        "text": checkbox["label"],
+                        "element": checkbox["element"],
+                        "type": "checkbox"
+                    })
         
         elif len(best["selects"]) > 0:
             result["field_type"] = "select"
@@ -622,17 +1070,14 @@ def extract_question_structure(use_interactive=False):
             
             select_elem = best["selects"][0]
             try:
-                from selenium.webdriver.support.select import Select
-                select = Select(select_elem)
-                for option in select.options:
-                    opt_text = option.text.strip()
-                    if opt_text:
+                for option in read_select_options(select_elem):
+                    if option["text"]:
                         result["options"].append({
-                            "text": opt_text,
-                            "element": option,
+                            "text": option["text"],
+                            "element": option["element"],
                             "type": "select"
                         })
-            except:
+            except WebDriverException:
                 pass
         
         elif len(best["text_inputs"]) > 0:
@@ -646,6 +1091,9 @@ def extract_question_structure(use_interactive=False):
         
         if result["options"]:
             print(f"    {Fore.CYAN}    Found {len(result['options'])} option(s)")
+            # Normalize once here so matching doesn't redo it per pass
+            for option in result["options"]:
+                option["_norm"] = normalize_answer(option["text"])
         
         return result
     
@@ -654,52 +1102,6 @@ def extract_question_structure(use_interactive=False):
         error_log.append(f"Question extraction: {str(e)[:80]}")
         return None
 
-def _extract_option_label(input_element):
-    """
-    Extract label text for a single input element (radio/checkbox).
-    Tries multiple strategies in order of reliability.
-    """
-    label_text = ""
-    
-    # Strategy 1: Parent label tag
-    try:
-        parent_label = input_element.find_element(By.XPATH, "ancestor::label[1]")
-        label_text = parent_label.text.strip()
-        if label_text:
-            return label_text
-    except:
-        pass
-    
-    # Strategy 2: aria-label attribute
-    label_text = input_element.get_attribute("aria-label") or ""
-    if label_text:
-        return label_text.strip()
-    
-    # Strategy 3: Following sibling span
-    try:
-        sibling = input_element.find_element(By.XPATH, "following-sibling::span[1]")
-        label_text = sibling.text.strip()
-        if label_text:
-            return label_text
-    except:
-        pass
-    
-    # Strategy 4: Parent div text (most likely to have unwanted text)
-    try:
-        parent = input_element.find_element(By.XPATH, "ancestor::div[1]")
-        label_text = parent.text.strip()
-        if label_text:
-            return label_text
-    except:
-        pass
-    
-    # Strategy 5: value attribute
-    label_text = input_element.get_attribute("value") or ""
-    if label_text:
-        return label_text.strip()
-    
-    return ""
-
 def match_answer_to_option(ai_answer, available_options):
     """
     BULLETPROOF MATCHING: Match AI answer to exact option with 4-strategy fallback.
@@ -711,21 +1113,30 @@ def match_answer_to_option(ai_answer, available_options):
     if not available_options:
         return None
     
-    # Normalize the AI answer once
+    # Normalize and tokenize the AI answer once, not per option
     ai_norm = normalize_answer(ai_answer)
+    ai_tokens = ai_norm.split()
+    ai_words = _word_set(ai_norm)
+    ai_first = ai_tokens[0] if ai_tokens else ""
+    
+    # Per-option data as parallel lists built once; the winner is tracked by index
+    opt_texts = [option["text"] for option in available_options]
+    opt_norms = [option.get("_norm") or normalize_answer(text) for option, text in zip(available_options, opt_texts)]
+    
+    # Strategy 1: EXACT MATCH - a single lookup, always wins over fuzzy scores
+    if ai_norm in opt_norms:
+        i = opt_norms.index(ai_norm)
+        print(f"    {Fore.GREEN}✓✓✓ EXACT MATCH: '{opt_texts[i]}'")
+        return {"option": available_options[i], "score": 1.0}
+    
+    opt_tokens = [norm.split() for norm in opt_norms]
     
-    best_match = None
+    best_index = None
     best_score = 0.0
     
     # Evaluate each option
-    for option in available_options:
-        opt_text = option["text"]
-        opt_norm = normalize_answer(opt_text)
-        
-        # Strategy 1: EXACT MATCH
-        if ai_norm == opt_norm:
-            print(f"    {Fore.GREEN}✓✓✓ EXACT MATCH: '{opt_text}'")
-            return {"option": option, "score": 1.0}
+    for i, opt_norm in enumerate(opt_norms):
+        opt_text = opt_texts[i]
         
         # Strategy 2: SUBSTRING (AI answer is part of option text)
         if ai_norm in opt_norm or opt_norm in ai_norm:
@@ -733,12 +1144,11 @@ def match_answer_to_option(ai_answer, available_options):
             print(f"    {Fore.GREEN}✓✓ Substring match: '{opt_text}' ({score:.0%})")
             if score > best_score:
                 best_score = score
-                best_match = {"option": option, "score": score}
+                best_index = i
             continue
         
         # Strategy 3: WORD OVERLAP (Jaccard similarity)
-        ai_words = set(ai_norm.split())
-        opt_words = set(opt_norm.split())
+        opt_words = _word_set(opt_norm)
         
         if ai_words and opt_words:
             overlap = len(ai_words & opt_words) / max(len(ai_words), len(opt_words))
@@ -747,26 +1157,28 @@ def match_answer_to_option(ai_answer, available_options):
                 print(f"    {Fore.YELLOW}↳ Word overlap: '{opt_text}' ({overlap:.0%})")
                 if overlap > best_score:
                     best_score = overlap
-                    best_match = {"option": option, "score": overlap}
+                    best_index = i
+                if overlap == 1.0:
+                    # Same words in another order; nothing can score higher
+                    break
                 continue
         
         # Strategy 4: FIRST WORD MATCH
-        ai_first = ai_norm.split()[0] if ai_norm else ""
-        opt_first = opt_norm.split()[0] if opt_norm else ""
+        opt_first = opt_tokens[i][0] if opt_tokens[i] else ""
         
         if ai_first and opt_first and ai_first == opt_first:
             score = 0.5
             print(f"    {Fore.YELLOW}↳ First word: '{opt_text}' ({score:.0%})")
             if score > best_score:
                 best_score = score
-                best_match = {"option": option, "score": score}
+                best_index = i
     
     # Return best match if found
-    if best_match and best_score >= 0.5:
+    if best_index is not None and best_score >= 0.5:
         print(f"\n    {Fore.GREEN}[✓] MATCH SELECTED")
-        print(f"    Option: '{best_match['option']['text']}'")
-        print(f"    Confidence: {best_match['score']:.0%}")
-        return best_match
+        print(f"    Option: '{opt_texts[best_index]}'")
+        print(f"    Confidence: {best_score:.0%}")
+        return {"option": available_options[best_index], "score": best_score}
     
     # Fallback: No match found
     print(f"\n    {Fore.RED}[!] No match found (best score: {best_score:.0%})")
@@ -787,7 +1199,7 @@ def select_answer_option(matched_option):
             strategies = [
                 ("Direct click", lambda: option_elem.click()),
                 ("Parent label click", lambda: option_elem.find_element(By.XPATH, "ancestor::label[1]").click()),
-                ("Scroll + click", lambda: (driver.execute_script("arguments[0].scrollIntoView(true);", option_elem), time.sleep(0.3), option_elem.click())),
+                ("Scroll + click", lambda: (driver.execute_script("arguments[0].scrollIntoView(true);", option_elem), option_elem.click())),
                 ("JavaScript click", lambda: driver.execute_script("arguments[0].click();", option_elem))
             ]
             
@@ -795,23 +1207,26 @@ def select_answer_option(matched_option):
                 try:
                     print(f"    Trying: {strategy_name}...")
                     strategy_func()
-                    time.sleep(0.5)
                     
-                    # Verify selection
-                    if option_elem.is_selected():
-                        print(f"    {Fore.GREEN}✓ Success!")
-                        return True
+                    # Verify selection as soon as the browser reports it
+                    WebDriverWait(driver, SELECTION_WAIT_TIMEOUT, poll_frequency=SELECTION_POLL_INTERVAL).until(
+                        lambda d: option_elem.is_selected()
+                    )
+                    print(f"    {Fore.GREEN}✓ Success!")
+                    return True
+                except TimeoutException:
+                    print(f"    {Fore.YELLOW}  Not selected after {SELECTION_WAIT_TIMEOUT}s")
+                    continue
                 except Exception as e:
                     print(f"    {Fore.YELLOW}  Failed: {str(e)[:40]}")
                     continue
         
         elif field_type == "select":
             try:
-                from selenium.webdriver.support.select import Select
                 select_elem = option_elem.find_element(By.XPATH, "ancestor::select[1]")
                 select = Select(select_elem)
                 select.select_by_value(option_elem.get_attribute("value"))
-                time.sleep(0.3)
+                wait_until_checked(option_elem, 0.3)
                 print(f"    {Fore.GREEN}✓ Selected from dropdown")
                 return True
             except Exception as e:
@@ -820,7 +1235,7 @@ def select_answer_option(matched_option):
         elif field_type == "text":
             try:
                 option_elem.click()
-                time.sleep(0.2)
+                wait_until_focused(option_elem, 0.2)
                 print(f"    {Fore.GREEN}✓ Text field ready")
                 return True
             except Exception as e:
@@ -842,6 +1257,161 @@ def auto_calibrate_page():
     print(f"\n{Fore.YELLOW}[!] auto_calibrate_page() is deprecated. Using extract_question_structure() instead.")
     return None
 
+# Selector cascades are evaluated in-page so a whole list costs one driver call.
+VISIBLE_MATCHES_JS = OPTION_LABEL_JS + """
+function visibleMatches(selector) {
+    return Array.from(document.querySelectorAll(selector)).filter(
+        el => isVisible(el) && el.getAttribute('aria-hidden') !== 'true');
+}
+"""
+
+# arguments: [selectors in priority order, minimum matches, include labels]
+FIRST_VISIBLE_GROUP_JS = VISIBLE_MATCHES_JS + """
+const [selectors, minCount, withLabels] = arguments;
+for (let i = 0; i < selectors.length; i++) {
+    const elements = visibleMatches(selectors[i]);
+    if (elements.length >= minCount) {
+        return {index: i, elements: elements, labels: withLabels ? elements.map(optionLabel) : null};
+    }
+}
+return null;
+"""
+
+# arguments: [[selectors, minimum matches, include labels], ...] - runs several
+# FIRST_VISIBLE_GROUP_JS cascades in order and stops at the first hit
+FIRST_VISIBLE_FIELD_JS = VISIBLE_MATCHES_JS + """
+const groups = arguments[0];
+for (let g = 0; g < groups.length; g++) {
+    const [selectors, minCount, withLabels] = groups[g];
+    for (let i = 0; i < selectors.length; i++) {
+        const elements = visibleMatches(selectors[i]);
+        if (elements.length >= minCount) {
+            return {group: g, index: i, elements: elements, labels: withLabels ? elements.map(optionLabel) : null};
+        }
+    }
+}
+return null;
+"""
+
+# arguments: [selectors] -> list of visible matches per selector
+ALL_VISIBLE_GROUPS_JS = VISIBLE_MATCHES_JS + """
+return arguments[0].map(visibleMatches);
+"""
+
+# arguments: [[By strategy, selector], ...] in priority order, then an optional
+# keyword alternation. Mirrors find_element() + is_displayed() per selector,
+# XPath included; if none matches, the first visible <button> whose text
+# matches the keywords is returned with index -1.
+FIRST_VISIBLE_MATCH_JS = IS_VISIBLE_JS + """
+const [candidates, keywordPattern] = arguments;
+for (let i = 0; i < candidates.length; i++) {
+    const [by, selector] = candidates[i];
+    const el = by === 'xpath'
+        ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(selector);
+    if (el && isVisible(el)) return {index: i, element: el};
+}
+if (keywordPattern) {
+    const keywords = new RegExp(keywordPattern, 'i');
+    for (const button of document.getElementsByTagName('button')) {
+        if (isVisible(button) && keywords.test(button.innerText || '')) return {index: -1, element: button};
+    }
+}
+return null;
+"""
+
+# arguments: [question element]. Same priority as the old per-type probes:
+# text input, radio group (2+), checkboxes, then a visible <select>.
+DETECT_FIELD_TYPE_JS = OPTION_LABEL_JS + """
+const root = arguments[0];
+const textInput = Array.from(root.querySelectorAll(
+    "input[type='text'], textarea, input[type='email'], input[type='number']"
+)).find(el => isVisible(el) && el.getAttribute('aria-hidden') !== 'true');
+if (textInput) return {type: 'text', element: textInput};
+
+const visibleOptions = selector =>
+    Array.from(root.querySelectorAll(selector)).map(describeOption).filter(o => o.visible);
+const radios = root.querySelectorAll("input[type='radio']");
+if (radios.length > 1) {
+    const options = visibleOptions("input[type='radio']");
+    if (options.length) return {type: 'radio', options: options};
+}
+const checkboxes = visibleOptions("input[type='checkbox']");
+if (checkboxes.length) return {type: 'checkbox', options: checkboxes};
+
+const select = root.querySelector('select');
+if (select && isVisible(select)) return {type: 'select', element: select};
+return null;
+"""
+
+SELECT_OPTIONS_JS = """
+return Array.from(arguments[0].options).map(
+    o => ({element: o, text: (o.text || '').trim(), value: o.value}));
+"""
+
+def read_select_options(select_elem):
+    """Return [{element, text, value}, ...] for a <select> in one in-page call."""
+    return driver.execute_script(SELECT_OPTIONS_JS, select_elem) or []
+
+# Checkbox options first, then radio, as {element, text, type}
+YAKLASS_CHOICE_OPTIONS_JS = """
+const items = arguments[0].querySelectorAll('.gxs-answer-select li');
+const found = [];
+for (const kind of ['checkbox', 'radio']) {
+    for (const li of items) {
+        const input = li.querySelector("input[type='" + kind + "']");
+        const label = li.querySelector('label .select-text');
+        if (input && label) found.push({element: input, text: label.innerText.trim(), type: kind});
+    }
+}
+return found;
+"""
+
+def read_yaklass_choice_options(question_element):
+    """Return the Yaklass checkbox/radio options of a question in one in-page call."""
+    return driver.execute_script(YAKLASS_CHOICE_OPTIONS_JS, question_element) or []
+
+# arguments: [question selectors in priority order]. The first visible match
+# and its text without required-field '*' marks, or null when no question
+# container is on the page.
+YAKLASS_QUESTION_JS = IS_VISIBLE_JS + """
+for (const selector of arguments[0]) {
+    for (const el of document.querySelectorAll(selector)) {
+        if (isVisible(el)) return {element: el, text: (el.innerText || '').replace(/\\*/g, '').trim()};
+    }
+}
+return null;
+"""
+
+def read_yaklass_question():
+    """
+    Locate the current Yaklass question and read its text in one in-page call.
+    
+    Returns:
+        tuple: (question element, question text) or (None, "") if not found
+    """
+    found = driver.execute_script(YAKLASS_QUESTION_JS, list(YAKLASS_QUESTION_SELECTORS))
+    if not found:
+        return None, ""
+    return found["element"], found["text"]
+
+def find_first_visible_group(selectors, min_count=1, with_labels=False):
+    """
+    Try CSS selectors in order and return the first one with enough visible matches.
+    
+    Args:
+        selectors (list): CSS selectors in priority order
+        min_count (int): Minimum number of visible matches required
+        with_labels (bool): Also resolve option label text for each match
+    
+    Returns:
+        tuple: (selector, elements, labels) or None if no selector matched
+    """
+    found = driver.execute_script(FIRST_VISIBLE_GROUP_JS, list(selectors), min_count, with_labels)
+    if not found:
+        return None
+    return selectors[found["index"]], found["elements"], found["labels"]
+
 def calibrate_google_forms():
     """
     Calibrate Google Forms page structure.
@@ -858,92 +1428,68 @@ def calibrate_google_forms():
         }
         
         # Find all potential question containers
-        question_selectors = [
-            ("div[data-item-id]", "data-item-id"),
-            ("div[role='heading']", "role='heading'"),
-            ("div[class*='question']", "class*='question'"),
-            ("div[class*='item']", "class*='item'"),
-            ("div[class*='prompt']", "class*='prompt'"),
-        ]
-        
         all_questions = []
-        for selector, desc in question_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    all_questions.extend([(elem, desc) for elem in elements if elem.is_displayed()])
-            except:
-                pass
+        try:
+            groups = driver.execute_script(ALL_VISIBLE_GROUPS_JS, [selector for selector, _ in GOOGLE_FORMS_QUESTION_CONTAINER_SELECTORS])
+            for (selector, desc), elements in zip(GOOGLE_FORMS_QUESTION_CONTAINER_SELECTORS, groups):
+                all_questions.extend([(elem, desc) for elem in elements])
+        except WebDriverException:
+            pass
         
         # Deduplicate and store
         calibration["question_elements"] = list(set(all_questions)) if all_questions else []
         
-        # Find answer field and determine type
-        text_field = find_google_forms_text_field()
-        if text_field:
-            calibration["answer_field_info"] = text_field
-            calibration["field_type"] = "text"
-            print(f"{Fore.CYAN}[+] Detected field type: TEXT INPUT")
-        else:
-            # Check for multiple choice
-            radio_field = find_google_forms_radio_buttons()
-            if radio_field:
-                calibration["answer_field_info"] = radio_field
-                calibration["field_type"] = "radio"
-                print(f"{Fore.CYAN}[+] Detected field type: RADIO BUTTONS ({radio_field.get('count', 0)} options)")
+        # Find answer field and determine type (text, radio, checkbox, select)
+        field_type, field_info = find_google_forms_answer_field()
+        if field_type:
+            calibration["answer_field_info"] = field_info
+            calibration["field_type"] = field_type
+            if "count" in field_info:
+                print(f"{Fore.CYAN}[+] Detected field type: {FIELD_TYPE_LABELS[field_type]} ({field_info['count']} options)")
             else:
-                checkbox_field = find_google_forms_checkboxes()
-                if checkbox_field:
-                    calibration["answer_field_info"] = checkbox_field
-                    calibration["field_type"] = "checkbox"
-                    print(f"{Fore.CYAN}[+] Detected field type: CHECKBOXES ({checkbox_field.get('count', 0)} options)")
-                else:
-                    select_field = find_google_forms_select()
-                    if select_field:
-                        calibration["answer_field_info"] = select_field
-                        calibration["field_type"] = "select"
-                        print(f"{Fore.CYAN}[+] Detected field type: SELECT DROPDOWN")
+                print(f"{Fore.CYAN}[+] Detected field type: {FIELD_TYPE_LABELS[field_type]}")
         
         return calibration
     except Exception as e:
         error_log.append(f"Calibration error: {str(e)[:80]}")
         return None
 
+def find_google_forms_answer_field():
+    """
+    Run the text, radio, checkbox and select cascades in one in-page call.
+    
+    Returns:
+        tuple: (field_type, field_info) with field_info shaped like the
+               single-type finders below, or (None, None) if nothing matched
+    """
+    groups = [[list(selectors), min_count, min_count > 1] for _, selectors, min_count in GOOGLE_FORMS_FIELD_GROUPS]
+    found = driver.execute_script(FIRST_VISIBLE_FIELD_JS, groups)
+    if not found:
+        return (None, None)
+    
+    field_type, selectors, _ = GOOGLE_FORMS_FIELD_GROUPS[found["group"]]
+    selector = selectors[found["index"]]
+    if field_type in ("radio", "checkbox"):
+        options = list(zip(found["elements"], found["labels"]))
+        return (field_type, {"elements": options, "selector": selector, "count": len(options), "type": field_type})
+    return (field_type, {"element": found["elements"][0], "selector": selector, "type": field_type})
+
 def find_google_forms_text_field():
     """
     Find text input/textarea field in Google Forms.
     Returns element with additional metadata.
     """
-    text_selectors = [
-        "input[type='text'][aria-label]",
-        "textarea[aria-label]",
-        "input[type='text'][aria-describedby]",
-        "textarea[aria-describedby]",
-        "input[type='text'][class*='input']",
-        "textarea[class*='textarea']",
-        "input[type='email']",
-        "input[type='url']",
-        "input[type='number']",
-        "div[role='textbox'][contenteditable='true']",
-        "input[type='text']:not([aria-hidden])",
-        "textarea:not([aria-hidden])",
-    ]
-    
-    for selector in text_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for elem in elements:
-                if elem.is_displayed() and not elem.get_attribute('aria-hidden'):
-                    # Get parent context for better identification
-                    parent = elem.find_element(By.XPATH, "..")
-                    return {
-                        "element": elem,
-                        "selector": selector,
-                        "parent": parent,
-                        "type": "text"
-                    }
-        except:
-            pass
+    try:
+        found = find_first_visible_group(GOOGLE_FORMS_TEXT_SELECTORS)
+        if found:
+            selector, elements, _ = found
+            return {
+                "element": elements[0],
+                "selector": selector,
+                "type": "text"
+            }
+    except WebDriverException:
+        pass
     
     return None
 
@@ -952,102 +1498,43 @@ def find_google_forms_radio_buttons():
     Find radio button group in Google Forms with their labels.
     Returns list of (element, label_text) tuples with metadata.
     """
-    radio_selectors = [
-        # Primary: Find by data-item-id (question container) then radio inputs within
-        ("div[data-item-id] input[type='radio']", "data-item-id input[type='radio']"),
-        # Secondary: Role-based
-        ("div[role='radio']", "role='radio'"),
-        # Tertiary: Find option containers with radio
-        ("div[class*='option'] input[type='radio']", "option input[type='radio']"),
-        # Fallback: Just radio inputs
-        ("input[type='radio']", "input[type='radio']"),
-    ]
-    
-    for selector, desc in radio_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            visible_elements = []
-            
-            for elem in elements:
-                try:
-                    if not elem.is_displayed():
-                        continue
-                    if elem.get_attribute('aria-hidden') == 'true':
-                        continue
-                    
-                    # Get associated label text
-                    label_text = ""
-                    
-                    # Try to find parent label
-                    try:
-                        parent_label = elem.find_element(By.XPATH, "ancestor::label[1]")
-                        label_text = parent_label.text.strip()
-                    except:
-                        pass
-                    
-                    # If no label, try aria-label
-                    if not label_text:
-                        label_text = elem.get_attribute('aria-label') or ""
-                    
-                    # If still no label, try next sibling span
-                    if not label_text:
-                        try:
-                            next_span = elem.find_element(By.XPATH, "following-sibling::span[1]")
-                            label_text = next_span.text.strip()
-                        except:
-                            pass
-                    
-                    # Last resort: get parent div text
-                    if not label_text:
-                        try:
-                            parent_div = elem.find_element(By.XPATH, "ancestor::div[1]")
-                            label_text = parent_div.text.strip()
-                        except:
-                            label_text = elem.text.strip() or elem.get_attribute('value') or ""
-                    
-                    visible_elements.append((elem, label_text))
-                except:
-                    pass
-            
-            if len(visible_elements) > 1:  # Multiple options
-                print(f"{Fore.CYAN}[+] Found {len(visible_elements)} radio options using: {desc}")
-                return {
-                    "elements": visible_elements,
-                    "selector": selector,
-                    "count": len(visible_elements),
-                    "type": "radio"
-                }
-        except:
-            pass
+    try:
+        # Visibility, labels and the selector cascade in one driver call
+        found = find_first_visible_group(tuple(GOOGLE_FORMS_RADIO_DESCRIPTIONS), min_count=2, with_labels=True)
+        if found:
+            selector, elements, labels = found
+            desc = GOOGLE_FORMS_RADIO_DESCRIPTIONS[selector]
+            visible_elements = list(zip(elements, labels))
+            print(f"{Fore.CYAN}[+] Found {len(visible_elements)} radio options using: {desc}")
+            return {
+                "elements": visible_elements,
+                "selector": selector,
+                "count": len(visible_elements),
+                "type": "radio"
+            }
+    except WebDriverException:
+        pass
     
     return None
 
 def find_google_forms_checkboxes():
     """
-    Find checkbox group in Google Forms.
-    Returns list of checkbox elements with metadata.
+    Find checkbox group in Google Forms with their labels.
+    Returns list of (element, label_text) tuples with metadata.
     """
-    checkbox_selectors = [
-        "input[type='checkbox']",
-        "div[role='checkbox']",
-        "div[class*='checkbox'][role='button']",
-        "label[class*='checkbox']",
-        "div[class*='option'][class*='checkbox']",
-    ]
-    
-    for selector in checkbox_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            visible_elements = [e for e in elements if e.is_displayed() and not e.get_attribute('aria-hidden')]
-            if len(visible_elements) > 1:  # Multiple options
-                return {
-                    "elements": visible_elements,
-                    "selector": selector,
-                    "count": len(visible_elements),
-                    "type": "checkbox"
-                }
-        except:
-            pass
+    try:
+        found = find_first_visible_group(GOOGLE_FORMS_CHECKBOX_SELECTORS, min_count=2, with_labels=True)
+        if found:
+            selector, elements, labels = found
+            visible_elements = list(zip(elements, labels))
+            return {
+                "elements": visible_elements,
+                "selector": selector,
+                "count": len(visible_elements),
+                "type": "checkbox"
+            }
+    except WebDriverException:
+        pass
     
     return None
 
@@ -1056,86 +1543,90 @@ def find_google_forms_select():
     Find dropdown select in Google Forms.
     Returns select element with metadata.
     """
-    select_selectors = [
-        "select[aria-label]",
-        "select[aria-describedby]",
-        "div[role='listbox']",
-        "div[class*='dropdown']",
-        "select",
-    ]
-    
-    for selector in select_selectors:
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, selector)
-            if element.is_displayed() and not element.get_attribute('aria-hidden'):
-                return {
-                    "element": element,
-                    "selector": selector,
-                    "type": "select"
-                }
-        except:
-            pass
+    try:
+        found = find_first_visible_group(GOOGLE_FORMS_SELECT_SELECTORS)
+        if found:
+            selector, elements, _ = found
+            return {
+                "element": elements[0],
+                "selector": selector,
+                "type": "select"
+            }
+    except WebDriverException:
+        pass
     
     return None
 
+def invalidate_platform_cache():
+    """Forget cached platforms, e.g. after reconnecting to Chrome."""
+    _platform_cache.clear()
+
+# Yaklass has a #taskhtml div, Google Forms has data-item-id question containers
+DETECT_PLATFORM_JS = """
+if (document.querySelector('div#taskhtml')) return 'yaklass';
+if (document.querySelector('div[data-item-id]')) return 'google_forms';
+return null;
+"""
+
 def detect_platform():
-    """Detect which platform we're on (Yaklass or Google Forms)."""
+    """Detect which platform we're on (Yaklass or Google Forms). Cached per host."""
     global CURRENT_PLATFORM
     try:
         current_url = driver.current_url.lower()
+        host = urlparse(current_url).netloc
+        if host in _platform_cache:
+            CURRENT_PLATFORM = _platform_cache[host]
+            return CURRENT_PLATFORM
         
         if "yaklass" in current_url or "якласс" in current_url:
             CURRENT_PLATFORM = "yaklass"
-            return "yaklass"
         elif "forms.google.com" in current_url or "google.com/forms" in current_url:
             CURRENT_PLATFORM = "google_forms"
-            return "google_forms"
         else:
-            # Try to detect by page structure
-            try:
-                # Yaklass has specific divs
-                driver.find_element(By.CSS_SELECTOR, "div#taskhtml")
+            # Try to detect by page structure, both probes in one call
+            detected = driver.execute_script(DETECT_PLATFORM_JS)
+            if not detected:
+                # Default to yaklass if unsure; not cached, a later page may tell
                 CURRENT_PLATFORM = "yaklass"
-                return "yaklass"
-            except:
-                try:
-                    # Google Forms has form elements
-                    driver.find_element(By.XPATH, "//div[@data-item-id]")
-                    CURRENT_PLATFORM = "google_forms"
-                    return "google_forms"
-                except:
-                    # Default to yaklass if unsure
-                    CURRENT_PLATFORM = "yaklass"
-                    return "yaklass"
+                return CURRENT_PLATFORM
+            CURRENT_PLATFORM = detected
+        
+        _platform_cache[host] = CURRENT_PLATFORM
+        return CURRENT_PLATFORM
     except Exception as e:
         print(f"{Fore.YELLOW}[!] Could not detect platform: {str(e)[:60]}")
         CURRENT_PLATFORM = "yaklass"
         return "yaklass"
 
-def normalize_answer(text):
-    return " ".join(text.lower().strip().split())
+# Answer cleanup patterns, compiled once
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+_CITATION_RE = re.compile(r'\[\d+\]|【\d+】')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_MARKDOWN_TABLE = str.maketrans('', '', '*_')
+_SENTENCE_SPLIT_RE = re.compile(r'[.\n!?]+')
 
+@lru_cache(maxsize=512)
 def clean_answer(text):
-    """Remove markdown, citations, and special symbols. Keep only words."""
-    import re
+    """Remove markdown, citations, and special symbols. Keep only words. Cached: models often repeat answers."""
+    # Remove <think> tags and content (before generic tag stripping eats the tags)
+    text = _THINK_RE.sub('', text)
     # Remove markdown bold/italic
-    text = re.sub(r'[*_]{1,3}', '', text)
-    # Remove citations [1], [2], etc.
-    text = re.sub(r'\[\d+\]', '', text)
+    text = text.translate(_MARKDOWN_TABLE)
+    # Remove citations [1], [2], 【1】, etc.
+    text = _CITATION_RE.sub('', text)
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Remove <think> tags and content
-    text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
+    text = _HTML_TAG_RE.sub('', text)
     # Remove extra whitespace
     text = " ".join(text.split())
     return text.strip()
 
-def find_current_question_element():
+def find_current_question_element(platform=None):
     """
     Find the first unanswered question element on the page.
     Uses ultra-smart extraction for precise identification.
+    Pass the platform when it is already known to skip re-detecting it.
     """
-    platform = detect_platform()
+    platform = platform or detect_platform()
     
     if platform == "google_forms":
         # Use ultra-smart extraction
@@ -1148,19 +1639,12 @@ def find_current_question_element():
             return None
     
     else:  # Yaklass
-        yaklass_selectors = [
-            "div#taskhtml",
-            "div.gxst-ibody",
-            "div.task-body",
-        ]
-        
-        for selector in yaklass_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                if elem.is_displayed():
-                    return elem
-            except:
-                pass
+        try:
+            found = find_first_visible_group(YAKLASS_QUESTION_SELECTORS)
+            if found:
+                return found[1][0]
+        except WebDriverException:
+            pass
     
     return None
 
@@ -1173,90 +1657,16 @@ def detect_question_field_type(question_element=None):
         return None
     
     try:
-        # Text input
-        text_inputs = question_element.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea, input[type='email'], input[type='number']")
-        for elem in text_inputs:
-            if elem.is_displayed() and elem.get_attribute('aria-hidden') != 'true':
-                print(f"{Fore.CYAN}[+] Field type: TEXT INPUT")
-                return (elem, "text")
-        
-        # Radio buttons
-        radio_inputs = question_element.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-        if len(radio_inputs) > 1:
-            radio_with_labels = []
-            for radio in radio_inputs:
-                if not radio.is_displayed():
-                    continue
-                
-                label_text = ""
-                try:
-                    parent_label = radio.find_element(By.XPATH, "ancestor::label[1]")
-                    label_text = parent_label.text.strip()
-                except:
-                    pass
-                
-                if not label_text:
-                    label_text = radio.get_attribute('aria-label') or ""
-                
-                if not label_text:
-                    try:
-                        next_span = radio.find_element(By.XPATH, "following-sibling::span[1]")
-                        label_text = next_span.text.strip()
-                    except:
-                        pass
-                
-                if not label_text:
-                    try:
-                        parent_div = radio.find_element(By.XPATH, "ancestor::div[1]")
-                        label_text = parent_div.text.strip()
-                    except:
-                        label_text = radio.get_attribute('value') or ""
-                
-                radio_with_labels.append((radio, label_text))
-            
-            if radio_with_labels:
-                print(f"{Fore.CYAN}[+] Field type: RADIO ({len(radio_with_labels)} options)")
-                return (radio_with_labels, "radio")
-        
-        # Checkboxes
-        checkboxes = question_element.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-        if len(checkboxes) >= 1:
-            checkbox_with_labels = []
-            for checkbox in checkboxes:
-                if not checkbox.is_displayed():
-                    continue
-                
-                label_text = ""
-                try:
-                    parent_label = checkbox.find_element(By.XPATH, "ancestor::label[1]")
-                    label_text = parent_label.text.strip()
-                except:
-                    pass
-                
-                if not label_text:
-                    label_text = checkbox.get_attribute('aria-label') or ""
-                
-                if not label_text:
-                    try:
-                        parent_div = checkbox.find_element(By.XPATH, "ancestor::div[1]")
-                        label_text = parent_div.text.strip()
-                    except:
-                        label_text = checkbox.get_attribute('value') or ""
-                
-                checkbox_with_labels.append((checkbox, label_text))
-            
-            if checkbox_with_labels:
-                print(f"{Fore.CYAN}[+] Field type: CHECKBOX ({len(checkbox_with_labels)} options)")
-                return (checkbox_with_labels, "checkbox")
-        
-        # Select dropdown
-        try:
-            select = question_element.find_element(By.CSS_SELECTOR, "select")
-            if select.is_displayed():
-                print(f"{Fore.CYAN}[+] Field type: SELECT")
-                return (select, "select")
-        except:
-            pass
+        # Text, radio, checkbox and select probes all run in one in-page call
+        found = driver.execute_script(DETECT_FIELD_TYPE_JS, question_element)
+        if found:
+            field_type = found["type"]
+            if field_type in ("radio", "checkbox"):
+                options = [(item["element"], item["label"]) for item in found["options"]]
+                print(f"{Fore.CYAN}[+] Field type: {field_type.upper()} ({len(options)} options)")
+                return (options, field_type)
+            print(f"{Fore.CYAN}[+] Field type: {'TEXT INPUT' if field_type == 'text' else 'SELECT'}")
+            return (found["element"], field_type)
     
     except Exception as e:
         error_log.append(f"Field type detection: {str(e)[:80]}")
@@ -1266,7 +1676,7 @@ def detect_question_field_type(question_element=None):
 def extract_question_text(platform, question_element=None):
     """Extract question text from specific question element."""
     if question_element is None:
-        question_element = find_current_question_element()
+        question_element = find_current_question_element(platform)
     
     full_content = ""
     
@@ -1276,29 +1686,7 @@ def extract_question_text(platform, question_element=None):
     
     try:
         if platform == "google_forms":
-            question_selectors = [
-                "div[role='heading']",
-                "div[class*='prompt']",
-                "span[class*='title']",
-                "div[class*='text']",
-                "span",
-            ]
-            
-            for selector in question_selectors:
-                try:
-                    elements = question_element.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        text = elem.text.strip()
-                        if text and len(text) > 5 and "*" not in text[:3]:
-                            full_content = text
-                            break
-                    if full_content:
-                        break
-                except:
-                    pass
-            
-            if not full_content:
-                full_content = question_element.text.strip()
+            full_content = driver.execute_script(QUESTION_TEXT_JS, question_element, list(GOOGLE_FORMS_QUESTION_TEXT_SELECTORS)) or ""
         
         else:
             full_content = question_element.text.strip()
@@ -1311,14 +1699,13 @@ def extract_question_text(platform, question_element=None):
 
 def extract_core_answer(text):
     """Extract the core 2-5 word answer from a full response."""
-    import re
     # Clean first
     text = clean_answer(text)
     if not text:
         return ""
     
     # Split into sentences (period, newline, etc.)
-    sentences = re.split(r'[.\n!?]+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     
     # Get first sentence that has actual content
     for sentence in sentences:
@@ -1332,106 +1719,220 @@ def extract_core_answer(text):
     words = text.split()[:MAX_ANSWER_EXTRACT_WORDS]
     return " ".join(words)
 
-def similarity_score(ans1, ans2):
-    norm1 = normalize_answer(ans1)
-    norm2 = normalize_answer(ans2)
-    
+def answer_complete(text):
+    """True once more streamed text can no longer change extract_core_answer(text)."""
+    if "<think>" in text and "</think>" not in text:
+        return False
+    # Uncached clean: partial replies would only crowd out the cache
+    sentences = _SENTENCE_SPLIT_RE.split(clean_answer.__wrapped__(text))
+    # Every piece but the last is a finished sentence
+    if any(len(sentence.strip()) > 1 for sentence in sentences[:-1]):
+        return True
+    return len(sentences[-1].split()) > MAX_ANSWER_EXTRACT_WORDS
+
+def read_answer_stream(stream):
+    """Collect a streamed completion, closing it as soon as the kept answer is complete."""
+    parts = []
+    try:
+        for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                parts.append(content)
+                if answer_complete("".join(parts)):
+                    break
+    finally:
+        stream.close()
+    return "".join(parts).strip()
+
+@lru_cache(maxsize=4096)
+def _word_set(norm):
+    return frozenset(norm.split())
+
+def normalized_similarity(norm1, norm2):
+    """Similarity of two already-normalized answers (0.0 - 1.0)."""
     if norm1 == norm2:
         return 1.0
     if norm1 in norm2 or norm2 in norm1:
         return 0.8
     
-    words1 = set(norm1.split())
-    words2 = set(norm2.split())
+    words1 = _word_set(norm1)
+    words2 = _word_set(norm2)
     if words1 and words2:
         overlap = len(words1 & words2) / max(len(words1), len(words2))
         return overlap
     return 0.0
 
-def query_perplexity(model, question):
+# One byte-identical prompt prefix for every model and question, so providers
+# that cache prompt prefixes server-side can reuse it
+ANSWER_SYSTEM_PROMPT = "Output ONLY the direct answer in 2-3 words. No explanation."
+
+def build_answer_messages(question):
+    """Chat messages for an answer request: the shared system prompt, then the question."""
+    return [
+        {"role": "system", "content": ANSWER_SYSTEM_PROMPT},
+        {"role": "user", "content": f"Answer: {question}"}
+    ]
+
+def remaining_time(deadline):
+    """Seconds a query may still take: QUERY_TIMEOUT, capped by the caller's deadline."""
+    if deadline is None:
+        return QUERY_TIMEOUT
+    return min(QUERY_TIMEOUT, deadline - time.monotonic())
+
+# Default for callers that never abandon a query early
+_NEVER_CANCELLED = threading.Event()
+
+def answer_max_tokens(model):
+    """Output token cap for one answer from this model."""
+    if any(marker in model for marker in REASONING_MODEL_MARKERS):
+        return REASONING_ANSWER_MAX_TOKENS
+    return ANSWER_MAX_TOKENS
+
+def query_perplexity(model, question, deadline=None, cancelled=_NEVER_CANCELLED):
     """
     Query Perplexity API with exponential backoff retry logic.
     
     Args:
         model (str): Model name (e.g., 'sonar-pro')
         question (str): Question text to answer
+        deadline (float): time.monotonic() after which no request or retry is started
+        cancelled (threading.Event): Set once the answer is no longer needed
     
     Returns:
         str: Model's answer or None on failure
         
     Note:
-        max_tokens=100: Allows complete responses for long Russian questions.
+        max_tokens: answer_max_tokens() - enough for the few words kept, more for reasoning models.
     """
     backoff = INITIAL_BACKOFF
     for attempt in range(1, MAX_QUERY_RETRIES + 1):
+        request_timeout = remaining_time(deadline)
+        if request_timeout <= 0 or cancelled.is_set():
+            break
         try:
             response = perplexity_client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "Output ONLY the direct answer in 2-3 words. No explanation."},
-                    {"role": "user", "content": f"Answer: {question}"}
-                ],
+                messages=build_answer_messages(question),
                 temperature=0.2,
-                max_tokens=100,
-                timeout=QUERY_TIMEOUT
+                max_tokens=answer_max_tokens(model),
+                timeout=request_timeout,
+                stream=True
             )
-            return response.choices[0].message.content.strip()
+            return read_answer_stream(response)
         except Exception as e:
             msg = str(e)
             error_log.append(f"Perplexity {model} attempt {attempt}: {msg[:MAX_ERROR_MSG_LENGTH]}")
-            if attempt < MAX_QUERY_RETRIES:
-                time.sleep(backoff)
+            if attempt < MAX_QUERY_RETRIES and remaining_time(deadline) > backoff:
+                # Wakes up early and gives up once the caller has its quorum
+                if cancelled.wait(backoff):
+                    break
                 backoff = min(backoff * BACKOFF_MULTIPLIER, MAX_BACKOFF)
     return None
 
-def query_groq(model, question):
+def query_groq(model, question, deadline=None, cancelled=_NEVER_CANCELLED):
     """
     Query Groq API with exponential backoff retry logic.
     
     Args:
         model (str): Model name (e.g., 'llama-3.3-70b-versatile')
         question (str): Question text to answer
+        deadline (float): time.monotonic() after which no request or retry is started
+        cancelled (threading.Event): Set once the answer is no longer needed
     
     Returns:
         str: Model's answer or None on failure
     """
     backoff = INITIAL_BACKOFF
     for attempt in range(1, MAX_QUERY_RETRIES + 1):
+        request_timeout = remaining_time(deadline)
+        if request_timeout <= 0 or cancelled.is_set():
+            break
         try:
             response = groq_client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "Output ONLY the direct answer in 2-3 words. No explanation."},
-                    {"role": "user", "content": f"Answer: {question}"}
-                ],
+                messages=build_answer_messages(question),
                 temperature=0.2,
-                max_tokens=100,
-                timeout=QUERY_TIMEOUT
+                max_tokens=answer_max_tokens(model),
+                timeout=request_timeout,
+                stream=True
             )
-            return response.choices[0].message.content.strip()
+            return read_answer_stream(response)
         except Exception as e:
             msg = str(e)
             error_log.append(f"Groq {model} attempt {attempt}: {msg[:MAX_ERROR_MSG_LENGTH]}")
-            if attempt < MAX_QUERY_RETRIES:
-                time.sleep(backoff)
+            if attempt < MAX_QUERY_RETRIES and remaining_time(deadline) > backoff:
+                # Wakes up early and gives up once the caller has its quorum
+                if cancelled.wait(backoff):
+                    break
                 backoff = min(backoff * BACKOFF_MULTIPLIER, MAX_BACKOFF)
     return None
 
-def get_answers_from_models(question, max_workers=5):
+def consensus_threshold(total_models):
+    """Votes an answer needs out of total_models answers to count as consensus."""
+    return min(max(MIN_REQUIRED, math.ceil(REQUIRED_RATIO * total_models)), total_models)
+
+def quorum_reached(votes, remaining):
+    """
+    Check whether the leading answer has already won the vote.
+    
+    Args:
+        votes (Counter): Normalized answer -> number of models that gave it
+        remaining (int): Number of models still pending
+    
+    Returns:
+        bool: True if the leader is a consensus even counting every pending
+              model, so waiting cannot change the outcome. A mere lead is not
+              enough: without consensus the Perplexity/best-match fallback
+              decides, and that needs all the answers.
+    """
+    top = votes.most_common(1)[0][1]
+    return top >= consensus_threshold(sum(votes.values()) + remaining)
+
+def warm_up_connection(client):
+    """Make a cheap request so the client's pool holds an open TLS connection."""
+    try:
+        client.with_options(max_retries=0, timeout=WARM_UP_TIMEOUT).models.list()
+    except Exception:
+        # Any response (even an error status) leaves the connection pooled
+        pass
+
+def warm_up_connections():
+    """
+    Open one keep-alive connection per working model in the background.
+    
+    Called when a run starts, so the DNS lookups and TLS handshakes overlap
+    with reading the page instead of delaying the first parallel query.
+    Warm-ups have their own small pool so real queries never queue behind them.
+    """
+    clients = {"perplexity": perplexity_client, "groq": groq_client}
+    for provider, _ in WORKING_MODELS:
+        WARM_UP_EXECUTOR.submit(warm_up_connection, clients[provider])
+
+def get_answers_from_models(question):
     answers = []
     responses = {}
     print(f"{Fore.CYAN}[*] Querying {len(WORKING_MODELS)} AI models (parallel)...")
 
+    # Adaptive timeout: 15-20s based on model count
+    timeout = min(20, max(15, len(WORKING_MODELS) * 1.5))
+    # Stragglers stop retrying at the deadline (or once quorum is reached)
+    # instead of holding pool threads
+    deadline = time.monotonic() + timeout
+    cancelled = threading.Event()
+
     def worker(provider, model):
         model_display = f"{provider.upper()}:{model}"
         try:
-            print(f"{Fore.YELLOW}    ↳ {model_display}...", flush=True)
+            print(f"{Fore.YELLOW}    ↳ {model_display}...")
             if provider == "perplexity":
-                res = query_perplexity(model, question)
+                res = query_perplexity(model, question, deadline, cancelled)
             elif provider == "groq":
-                res = query_groq(model, question)
+                res = query_groq(model, question, deadline, cancelled)
             else:
                 res = None
+            if cancelled.is_set():
+                # Finished after the caller moved on; keep the next question's output clean
+                return (model_display, None, "Cancelled after quorum")
             if res:
                 # Extract core 2-3 word answer
                 core = extract_core_answer(res)
@@ -1445,24 +1946,33 @@ def get_answers_from_models(question, max_workers=5):
             error_log.append(f"Query {provider}/{model} error: {msg[:240]}")
             return (model_display, None, msg)
 
-    # Adaptive timeout: 15-20s based on model count
-    timeout = min(20, max(15, len(WORKING_MODELS) * 1.5))
     print(f"{Fore.CYAN}[*] Waiting for responses (timeout: {int(timeout)}s)...")
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(worker, provider, model) for provider, model in WORKING_MODELS]
-        done, not_done = concurrent.futures.wait(futures, timeout=timeout)
-
-        if not_done:
-            error_log.append(f"Timeout: {len(not_done)} model(s) slow")
-
-        for fut in done:
+    futures = [AI_EXECUTOR.submit(worker, provider, model) for provider, model in WORKING_MODELS]
+    pending = set(futures)
+    votes = Counter()
+    
+    try:
+        for fut in concurrent.futures.as_completed(futures, timeout=timeout):
+            pending.discard(fut)
             try:
                 model_display, ans, err = fut.result()
             except Exception as e:
                 error_log.append(f"Worker exception: {str(e)[:240]}")
                 continue
             responses[model_display] = {"answer": ans, "error": err}
+            
+            if ans:
+                votes[normalize_answer(ans)] += 1
+                if pending and quorum_reached(votes, len(pending)):
+                    print(f"{Fore.GREEN}[+] Quorum reached, skipping {len(pending)} slower model(s)")
+                    break
+    except concurrent.futures.TimeoutError:
+        error_log.append(f"Timeout: {len(pending)} model(s) slow")
+    
+    cancelled.set()
+    for fut in pending:
+        fut.cancel()
 
     # Collect answers in order
     for provider, model in WORKING_MODELS:
@@ -1474,65 +1984,117 @@ def get_answers_from_models(question, max_workers=5):
     return answers
 
 def verify_and_select_answer(answers, required_matches=None):
+    """
+    Pick the answer to use from the models' answers.
+    
+    Returns:
+        tuple: (answer or None, True if it is a real consensus rather than a fallback)
+    """
     if not answers:
         print(f"{Fore.RED}[!] No answers received!")
-        return None
+        return None, False
     
     print(f"\n{Fore.CYAN}[*] Analyzing {len(answers)} answer(s)...")
-    best_answer = None
-    best_match_count = 0
-    counts = {}
-    per_provider_counts = {}
+    # Normalize once; identical answers collapse into one vote bucket
+    norms = [normalize_answer(a) for _, a in answers]
+    counts = Counter(norms)
+    norm_to_answer = {}
+    for (_, ans), norm_ans in zip(answers, norms):
+        norm_to_answer.setdefault(norm_ans, ans)
 
     total_models = len(answers)
     if required_matches is None:
-        required_matches = max(MIN_REQUIRED, math.ceil(REQUIRED_RATIO * total_models))
-        required_matches = min(required_matches, total_models)
-
-    # Find consensus answer
-    for norm_ans, cnt in counts.items():
-        if cnt >= required_matches:
-            candidate = next(a for _, a in answers if normalize_answer(a) == norm_ans)
-            print(f"{Fore.GREEN}[+] ✓ CONSENSUS (>= {required_matches}/{total_models}): {candidate}")
-            return candidate
+        required_matches = consensus_threshold(total_models)
 
+    # Find consensus answer: exact votes decide before any similarity work
+    top_norm, top_count = counts.most_common(1)[0]
+    if top_count >= required_matches:
+        candidate = norm_to_answer[top_norm]
+        print(f"{Fore.GREEN}[+] ✓ CONSENSUS (>= {required_matches}/{total_models}): {candidate}")
+        return candidate, True
+    
     # No consensus - fallback to Perplexity if enabled
     print(f"{Fore.YELLOW}[!] No consensus ({required_matches}). Fallback...")
     if PREFER_PERPLEXITY:
-        best_norm = None
-        best_perf = -1
-        for norm_ans, pdata in per_provider_counts.items():
-            perf = pdata.get('perplexity', 0)
-            if perf > best_perf:
-                best_perf = perf
-                best_norm = norm_ans
-        if best_norm:
-            candidate = next(a for _, a in answers if normalize_answer(a) == best_norm)
+        # Provider tallies are only needed here, not on the consensus path
+        perplexity_votes = Counter(
+            norm_ans for (model_display, _), norm_ans in zip(answers, norms)
+            if model_display.lower().startswith("perplexity:")
+        )
+        perf_norm = max(counts, key=lambda norm_ans: perplexity_votes[norm_ans])
+        if perplexity_votes[perf_norm] > 0:
+            candidate = norm_to_answer[perf_norm]
             print(f"{Fore.YELLOW}[!] Using Perplexity: {candidate}")
-            return candidate
-
-    # Final fallback: highest match count
+            return candidate, False
+
+    # Final fallback: highest match count. Only this path needs the pairwise
+    # pass: similar answers back each other, each distinct pair compared once
+    match_counts = dict(counts)
+    for norm1, norm2 in combinations(counts, 2):
+        if norm1 and norm2 and normalized_similarity(norm1, norm2) >= ANSWER_SIMILARITY_THRESHOLD:
+            match_counts[norm1] += counts[norm2]
+            match_counts[norm2] += counts[norm1]
+    best_norm = max(match_counts, key=match_counts.get)
+    best_answer = norm_to_answer[best_norm]
+    best_match_count = match_counts[best_norm]
     if best_answer:
-        print(f"{Fore.YELLOW}[!] Using best-match: {best_answer}")
-        return best_answer
-    return answers[0][1]
+        print(f"{Fore.YELLOW}[!] Using best-match ({best_match_count} supporting): {best_answer}")
+        return best_answer, False
+    return answers[0][1], False
+
+# Sets an <input>/<textarea> value through the native setter (so framework
+# listeners see it) and fires the events typing would; true if the value stuck
+SET_FIELD_VALUE_JS = """
+const [el, text] = arguments;
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+    : el instanceof HTMLInputElement ? HTMLInputElement.prototype : null;
+if (!proto) return false;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.value === text;
+"""
+
+# [value, rendered text] of a field, for checking what was typed
+FIELD_CONTENTS_JS = """
+const el = arguments[0];
+return [el.value === undefined ? null : String(el.value), el.innerText];
+"""
 
 def human_type(element, text):
-    """Type text character by character with human-like delays."""
+    """
+    Type text in short bursts with human-like delays.
+    With HUMAN_TYPING off the value is set in one in-page call, falling back
+    to a single send_keys for fields that refuse it (e.g. contenteditable).
+    """
+    if not HUMAN_TYPING_ENABLED:
+        try:
+            if driver.execute_script(SET_FIELD_VALUE_JS, element, text):
+                return
+        except WebDriverException:
+            pass
+    
     try:
         element.clear()
-    except Exception:
+    except WebDriverException:
         pass
     
-    for char in text:
-        element.send_keys(char)
-        time.sleep(random.uniform(TYPING_MIN_DELAY, TYPING_MAX_DELAY))
+    if not HUMAN_TYPING_ENABLED:
+        element.send_keys(text)
+        return
+    
+    for start in range(0, len(text), TYPING_CHUNK_SIZE):
+        chunk = text[start:start + TYPING_CHUNK_SIZE]
+        element.send_keys(chunk)
+        time.sleep(random.uniform(TYPING_MIN_DELAY, TYPING_MAX_DELAY) * len(chunk))
 
 def type_answer(answer, max_attempts=2):
     """
     Find answer field and type answer or select from options.
     Handles both text input and multiple choice (radio, checkbox, select).
     """
+    # What a correctly typed field starts with, computed once for all attempts
+    target_prefix = normalize_answer(answer)[:5]
     for attempt in range(1, max_attempts + 1):
         try:
             answer_field, field_type = find_answer_field()
@@ -1544,24 +2106,17 @@ def type_answer(answer, max_attempts=2):
             if field_type == 'text':
                 try:
                     answer_field.click()
-                except Exception:
+                except WebDriverException:
                     pass
                 
                 human_type(answer_field, answer)
                 
-                # Quick verification
+                # Quick verification: value (inputs) and text (contenteditable) in one call
                 try:
-                    val = answer_field.get_attribute('value')
-                    if val and normalize_answer(val).startswith(normalize_answer(answer)[:5]):
-                        return True
-                except Exception:
-                    pass
-                
-                try:
-                    text = answer_field.text
-                    if text and normalize_answer(text).startswith(normalize_answer(answer)[:5]):
-                        return True
-                except Exception:
+                    for typed in driver.execute_script(FIELD_CONTENTS_JS, answer_field):
+                        if typed and normalize_answer(typed).startswith(target_prefix):
+                            return True
+                except WebDriverException:
                     pass
             
             # Handle select dropdown
@@ -1612,40 +2167,51 @@ def select_best_match_option(options_element, answer, is_radio=False, is_checkbo
             best_score = 0.0
             best_label = ""
             
+            # Fast path: an option whose label is exactly the answer wins outright
             for option_elem, option_text in options_element:
-                try:
-                    if not option_text:
-                        option_text = option_elem.get_attribute('value') or ""
-                    
-                    if option_text:
-                        score = similarity_score(answer, option_text)
-                        print(f"{Fore.YELLOW}    Option '{option_text[:30]}': score={score:.2f}")
-                        if score > best_score:
-                            best_score = score
-                            best_match = option_elem
-                            best_label = option_text
-                except Exception as e:
-                    error_log.append(f"Option eval: {str(e)[:60]}")
+                if option_text and normalize_answer(option_text) == answer_norm:
+                    best_match, best_score, best_label = option_elem, 1.0, option_text
+                    break
+            
+            if best_match is None:
+                for option_elem, option_text in options_element:
+                    try:
+                        if not option_text:
+                            option_text = option_elem.get_attribute('value') or ""
+                        
+                        if option_text:
+                            score = normalized_similarity(answer_norm, normalize_answer(option_text))
+                            print(f"{Fore.YELLOW}    Option '{option_text[:30]}': score={score:.2f}")
+                            if score > best_score:
+                                best_score = score
+                                best_match = option_elem
+                                best_label = option_text
+                                if score == 1.0:
+                                    break
+                    except Exception as e:
+                        error_log.append(f"Option eval: {str(e)[:60]}")
             
             if best_match and best_score >= 0.3:
                 print(f"{Fore.GREEN}[+] Matching option: '{best_label}' (score={best_score:.2f})")
+                # Each wait ends as soon as the option reports itself checked;
+                # the old fixed sleep is only the upper bound
                 try:
                     best_match.click()
-                    time.sleep(0.5)
+                    wait_until_checked(best_match, 0.5)
                     return True
                 except Exception as click_err:
                     # Try clicking parent if input is not clickable
                     try:
                         parent = best_match.find_element(By.XPATH, "ancestor::label[1]")
                         parent.click()
-                        time.sleep(0.5)
+                        wait_until_checked(best_match, 0.5)
                         return True
-                    except:
+                    except WebDriverException:
                         # Try scrolling and clicking again
                         driver.execute_script("arguments[0].scrollIntoView(true);", best_match)
                         time.sleep(0.3)
                         best_match.click()
-                        time.sleep(0.5)
+                        wait_until_checked(best_match, 0.5)
                         return True
             else:
                 print(f"{Fore.RED}[!] No good match found (best score: {best_score:.2f})")
@@ -1653,24 +2219,26 @@ def select_best_match_option(options_element, answer, is_radio=False, is_checkbo
         else:
             # Select dropdown
             try:
-                from selenium.webdriver.support.select import Select
                 select = Select(options_element)
                 
-                best_match = None
-                best_score = 0.0
+                options = read_select_options(options_element)
                 
-                for option in select.options:
-                    option_text = option.text.strip()
-                    score = similarity_score(answer, option_text)
-                    if score > best_score:
-                        best_score = score
-                        best_match = option
+                # Fast path: exact option text, else fuzzy scoring
+                best_match = next((o for o in options if normalize_answer(o["text"]) == answer_norm), None)
+                best_score = 1.0 if best_match else 0.0
+                
+                if best_match is None:
+                    for option in options:
+                        score = normalized_similarity(answer_norm, normalize_answer(option["text"]))
+                        if score > best_score:
+                            best_score = score
+                            best_match = option
                 
                 if best_match and best_score > 0.3:
-                    select.select_by_value(best_match.get_attribute('value'))
-                    time.sleep(0.3)
+                    select.select_by_value(best_match["value"])
+                    wait_until_checked(best_match["element"], 0.3)
                     return True
-            except:
+            except WebDriverException:
                 pass
         
         return False
@@ -1679,13 +2247,14 @@ def select_best_match_option(options_element, answer, is_radio=False, is_checkbo
         error_log.append(f"Option selection: {str(e)[:100]}")
         return False
 
-def find_answer_field():
+def find_answer_field(platform=None):
     """
     Find answer input field - supports both Yaklass and Google Forms.
     Uses calibration for Google Forms for better stability.
+    Pass the platform when it is already known to skip re-detecting it.
     Returns: (field_element, field_type) where field_type is 'text', 'select', 'radio', or 'checkbox'
     """
-    platform = detect_platform()
+    platform = platform or detect_platform()
     
     if platform == "google_forms":
         # Use calibration for Google Forms
@@ -1704,6 +2273,11 @@ def find_answer_field():
             elif field_type == "select":
                 return (field_info["element"], "select")
         
+        # Calibration already ran every finder below; only retry them one by
+        # one when it failed outright (e.g. a driver error mid-cascade)
+        if calibration is not None:
+            return (None, None)
+        
         # Fallback: Manual detection without calibration
         # 1. Try text input field
         text_field = find_google_forms_text_field()
@@ -1726,133 +2300,156 @@ def find_answer_field():
             return (checkbox_field["elements"], "checkbox")
     
     else:  # Yaklass
-        # Original Yaklass selectors
-        selectors = [
-            "input.gxs-answer-text-short",
-            "input.gxs-answer-input",
-            "input[type='text'].answer",
-            "textarea.gxs-answer",
-            "input[placeholder*='ответ']",
-            "textarea[placeholder*='ответ']",
-            ".answer-input input",
-            ".answer-input textarea",
-        ]
-        
-        for selector in selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed():
-                    return (element, "text")
-            except:
-                pass
+        try:
+            found = find_first_visible_group(YAKLASS_ANSWER_SELECTORS)
+            if found:
+                return (found[1][0], "text")
+        except WebDriverException:
+            pass
     
     return (None, None)
 
-def find_submit_button():
+def find_first_visible_match(list_name, selectors, keywords=None):
+    """
+    Find the first visible element from a (By, selector) list in one in-page call.
+    The order is fixed: specific selectors first, broad fallbacks last.
+    
+    Args:
+        list_name (str): Label for error messages, e.g. 'submit:yaklass'
+        selectors (tuple): (By, selector) pairs in priority order
+        keywords (str): Optional button text alternation tried in the same call
+                        when no selector matches
+    
+    Returns:
+        WebElement or None
+    """
+    try:
+        # The (By, selector) tuples serialize as JSON arrays as they are
+        found = driver.execute_script(FIRST_VISIBLE_MATCH_JS, selectors, keywords)
+    except WebDriverException as e:
+        error_log.append(f"Selector probe {list_name}: {str(e)[:MAX_ERROR_MSG_LENGTH]}")
+        return None
+    return found["element"] if found else None
+
+def find_submit_button(platform=None):
     """
     Find the submit button - works for both Yaklass and Google Forms.
     Yaklass: 'Ответить!' or 'сохранить'
     Google Forms: 'Submit' or 'Next'
+    Pass the platform when it is already known to skip re-detecting it.
     """
-    platform = detect_platform()
-    
-    if platform == "google_forms":
-        # Google Forms submit buttons
-        selectors = [
-            "button[aria-label*='Submit']",
-            "button[aria-label*='submit']",
-            "div[role='button'][aria-label*='Submit']",
-            "//button[contains(text(), 'Submit')]",
-            "//button[contains(text(), 'Next')]",
-            "//button[contains(text(), 'next')]",
-        ]
-    else:
-        # Yaklass submit buttons
-        selectors = [
-            "//button[contains(text(), 'Ответить!')]",
-            "//button[contains(text(), 'Ответить')]",
-            "//button[contains(text(), 'ответить')]",
-            "//button[contains(text(), 'сохранить')]",
-        ]
-    
-    for selector in selectors:
-        try:
-            if "//" in selector:
-                button = driver.find_element(By.XPATH, selector)
-            else:
-                button = driver.find_element(By.CSS_SELECTOR, selector)
-            if button.is_displayed():
-                return button
-        except:
-            pass
-    
-    # Fallback: look for any visible button with submit/next/answer text
-    try:
-        buttons = driver.find_elements(By.TAG_NAME, "button")
-        for btn in buttons:
-            text = btn.text.lower()
-            if any(kw in text for kw in ["ответ", "сохран", "submit", "next", "дальше"]):
-                if btn.is_displayed():
-                    return btn
-    except:
-        pass
-    
-    return None
+    platform = platform or detect_platform()
+    platform_key = "google_forms" if platform == "google_forms" else "yaklass"
+    # Fallback in the same call: any visible button with submit/next/answer text
+    return find_first_visible_match(f"submit:{platform_key}", SUBMIT_BUTTON_SELECTORS[platform_key], SUBMIT_BUTTON_KEYWORDS)
 
-def find_next_button():
+def find_next_button(platform=None):
     """
     Find the next button to navigate to the next question.
     Yaklass: 'Дальше'
     Google Forms: 'Next' button after form submission
+    Pass the platform when it is already known; it is polled, and detection
+    costs a driver round-trip per call.
     """
-    platform = detect_platform()
-    
-    if platform == "google_forms":
-        # Google Forms next buttons
-        selectors = [
-            "button[aria-label*='Next']",
-            "//button[contains(text(), 'Next')]",
-            "div[role='button'][aria-label*='Next']",
-            "a[aria-label*='Next']",
-        ]
-    else:
-        # Yaklass next buttons
-        selectors = [
-            "//button[contains(text(), 'Дальше')]",
-            "//a[contains(text(), 'Дальше')]",
-            "//button[contains(text(), 'дальше')]",
-            "//a[contains(text(), 'дальше')]",
-            "a[href*='next']",
-            "a.next-question",
-            ".pagination a.next",
-        ]
-    
-    for selector in selectors:
-        try:
-            if "//" in selector:
-                button = driver.find_element(By.XPATH, selector)
-            else:
-                button = driver.find_element(By.CSS_SELECTOR, selector)
-            
-            if button.is_displayed():
-                return button
-        except:
-            pass
+    platform = platform or detect_platform()
+    platform_key = "google_forms" if platform == "google_forms" else "yaklass"
+    # Yaklass fallback in the same call: any visible button labelled 'Дальше' / 'next'
+    keywords = NEXT_BUTTON_KEYWORDS if platform_key == "yaklass" else None
+    return find_first_visible_match(f"next:{platform_key}", NEXT_BUTTON_SELECTORS[platform_key], keywords)
+
+def wait_for(condition, timeout, poll_interval=SELECTION_POLL_INTERVAL):
+    """
+    Poll a WebDriverWait condition instead of sleeping a fixed time.
     
-    return None
+    Returns:
+        The condition's truthy result, or None if it did not hold within timeout
+    """
+    try:
+        # Mid-navigation the driver can briefly fail; keep polling through it
+        wait = WebDriverWait(driver, timeout, poll_frequency=poll_interval, ignored_exceptions=(WebDriverException,))
+        return wait.until(condition)
+    except TimeoutException:
+        return None
 
-def solve_task():
-    global error_log, stats
-    error_log = []
-    question_start_time = time.time()
+OPTION_CHECKED_JS = """
+const el = arguments[0];
+return el.checked === true || el.selected === true || el.getAttribute('aria-checked') === 'true';
+"""
+FOCUSED_JS = "return document.activeElement === arguments[0];"
+
+def wait_until_checked(element, timeout):
+    """Wait (at most timeout) for a clicked option to report itself checked/selected."""
+    return wait_for(lambda d: d.execute_script(OPTION_CHECKED_JS, element), timeout)
+
+def wait_until_focused(element, timeout):
+    """Wait (at most timeout) for a clicked field to take focus."""
+    return wait_for(lambda d: d.execute_script(FOCUSED_JS, element), timeout)
+
+def page_ready(d):
+    return d.execute_script("return document.readyState") == "complete"
+
+def wait_for_navigation(clicked_element):
+    """After clicking a navigation control, wait for the old page to go away and the new one to load."""
+    wait_for(EC.staleness_of(clicked_element), NEXT_PAGE_WAIT_TIME)
+    wait_for(page_ready, NEXT_PAGE_WAIT_TIME)
+
+def prefetch_submit_button(platform):
+    """
+    Look up the submit button in the background while the AI models answer.
+    The next button is not prefetched: it only appears once the answer is
+    submitted, so it is polled for after the submit click instead.
+    """
+    return PREFETCH_EXECUTOR.submit(find_submit_button, platform)
+
+def prefetched_submit_button(future, platform):
+    """Return the prefetched submit button if it is still displayed, else search again (also when future is None)."""
+    try:
+        button = future.result(timeout=SELECTION_WAIT_TIMEOUT) if future else None
+        if button and button.is_displayed():
+            return button
+    except (WebDriverException, concurrent.futures.TimeoutError):
+        pass
+    return find_submit_button(platform)
+
+def prefetch_answer_field(platform):
+    """Look up the answer field in the background while the AI models answer."""
+    return PREFETCH_EXECUTOR.submit(find_answer_field, platform)
+
+def prefetched_answer_field(future, platform):
+    """Return the prefetched (field, field_type), searching again if it found nothing or future is None."""
+    try:
+        found = future.result(timeout=SELECTION_WAIT_TIMEOUT) if future else (None, None)
+        if found[0] is not None:
+            return found
+    except (WebDriverException, concurrent.futures.TimeoutError):
+        pass
+    return find_answer_field(platform)
+
+def solve_current_question(platform=None):
+    """
+    Solve the question on the current page, submit it and move on.
     
-    platform = detect_platform()
+    Args:
+        platform (str): Platform detected earlier in this run; detected here if None
+    
+    Returns:
+        str: 'next' after navigating to another question, 'done' when the
+             test has no next question, 'stop' when this question failed
+    """
+    global stats
+    error_log.clear()
+    # Wall clock only for the log timestamp; durations use the monotonic clock
+    question_started_at = datetime.now().isoformat()
+    question_start_time = time.monotonic()
+    
+    get_driver()
+    platform = platform or detect_platform()
     stats["questions_solved"] += 1
     q_num = stats["questions_solved"]
     
-    print(f"\n{Fore.CYAN}{'─'*60}")
-    print(f"{Fore.CYAN}[?] Question #{q_num} ({platform.upper()})")
-    print(f"{Fore.CYAN}{'─'*60}")
+    # One write per block: colorama translates every write call on Windows
+    rule = f"{Fore.CYAN}{'─'*60}"
+    print(f"\n{rule}\n{Fore.CYAN}[?] Question #{q_num} ({platform.upper()})\n{rule}")
     
     try:
         # Unified workflow for both platforms with robust error handling and retries
@@ -1867,14 +2464,55 @@ def solve_task():
                         raise
                     time.sleep(delay * (1.5 ** attempt))
 
+        # Page lookups started while the models answer, by name ('submit', 'field')
+        prefetches = {}
+
+        def get_answer(use_cache=True):
+            """Cached, locally computed or model answer for full_content: (answer, from_cache)."""
+            if use_cache and (cached := lookup_cached_answer(full_content)):
+                print(f"{Fore.GREEN}[+] Cached answer: {cached}")
+                return cached, True
+            # Yaklass checks fractions written with a decimal comma
+            if (local := solve_arithmetic(full_content, decimal_comma=platform == "yaklass")):
+                print(f"{Fore.GREEN}[+] Computed locally: {local}")
+                return local, False
+            # Only the model wait leaves the driver idle, so only it gets the
+            # background lookups; cache and arithmetic hits go straight on
+            prefetches["submit"] = prefetch_submit_button(platform)
+            if platform != "google_forms":
+                prefetches["field"] = prefetch_answer_field(platform)
+            try:
+                answers = retry(lambda: get_answers_from_models(full_content), err_msg="[!] AI answer fetch failed")
+            finally:
+                # Settle the lookups before this thread uses the driver again
+                concurrent.futures.wait(prefetches.values())
+            answer, consensus = verify_and_select_answer(answers)
+            if consensus:
+                store_cached_answer(full_content, answer)
+            return answer, False
+
+        def match_with_fresh_answer(ai_answer, from_cache, options):
+            """Match the answer to an option; a stale cached answer is evicted and the models asked instead."""
+            matched = match_answer_to_option(ai_answer, options)
+            if matched or not from_cache:
+                return ai_answer, matched
+            print(f"{Fore.YELLOW}[!] Cached answer fits no option, asking the models")
+            evict_cached_answer(full_content)
+            ai_answer, _ = get_answer(use_cache=False)
+            return ai_answer, ai_answer and match_answer_to_option(ai_answer, options)
+
         if platform == "google_forms":
             print(f"{Fore.CYAN}[*] Starting ultra-smart question extraction...")
             question_structure = retry(lambda: extract_question_structure(), err_msg="[!] Could not extract question structure")
             if not question_structure:
                 print(f"{Fore.RED}[!] Could not extract question structure")
                 stats["questions_failed"] += 1
-                return
-            full_content = question_structure["question_text"]
+                return "stop"
+            full_content = question_structure["question_text"].strip()
+            if not full_content:
+                print(f"{Fore.RED}[!] Question text is empty!")
+                stats["questions_failed"] += 1
+                return "stop"
             available_options = question_structure["options"]
             field_type = question_structure["field_type"]
             print(f"{Fore.CYAN}[+] Question text: {full_content[:MAX_QUESTION_PREVIEW_LENGTH]}...")
@@ -1888,176 +2526,150 @@ def solve_task():
                     print(f"{Fore.YELLOW}[!] Type mismatch detected. Retrying with interactive mode...")
                     interactive_element_selector()
                     stats["questions_failed"] += 1
-                    return
+                    return "stop"
             
-            if not full_content.strip():
-                print(f"{Fore.RED}[!] Question text is empty!")
-                stats["questions_failed"] += 1
-                return
             print(f"{Fore.CYAN}[*] Getting AI answers...")
-            answers = retry(lambda: get_answers_from_models(full_content), err_msg="[!] AI answer fetch failed")
-            ai_answer = verify_and_select_answer(answers)
+            ai_answer, from_cache = get_answer()
             if not ai_answer:
                 print(f"{Fore.RED}[!] No consensus reached from AI models")
                 stats["questions_failed"] += 1
-                return
+                return "stop"
             print(f"{Fore.CYAN}[*] Matching AI answer to available options...")
-            matched = match_answer_to_option(ai_answer, available_options)
+            ai_answer, matched = match_with_fresh_answer(ai_answer, from_cache, available_options)
             if not matched:
                 print(f"{Fore.RED}[!] Could not match answer to any option")
                 stats["questions_failed"] += 1
-                return
+                return "stop"
             print(f"{Fore.CYAN}[*] Selecting the matched option...")
             success = retry(lambda: select_answer_option(matched), err_msg="[!] Failed to select answer option")
             if not success:
                 print(f"{Fore.RED}[!] Failed to select answer option")
                 stats["questions_failed"] += 1
-                return
+                return "stop"
             print(f"{Fore.GREEN}[✓] Answer selected successfully!")
         else:
             print(f"{Fore.CYAN}[*] Finding current question...")
-            question_element = retry(lambda: find_current_question_element(), err_msg="[!] Could not find current question element")
+            # Locating the question and reading its text is a single in-page call
+            question_element, full_content = retry(read_yaklass_question, err_msg="[!] Could not find current question element")
             if question_element is None:
                 print(f"{Fore.RED}[!] Could not find current question element")
                 stats["questions_failed"] += 1
-                return
-            print(f"{Fore.CYAN}[*] Extracting question text...")
-            full_content = extract_question_text(platform, question_element)
-            if not full_content.strip():
+                return "stop"
+            if not full_content:
                 print(f"{Fore.RED}[!] Question text is empty!")
                 stats["questions_failed"] += 1
-                return
+                return "stop"
             print(f"{Fore.CYAN}[+] Question: {full_content[:MAX_QUESTION_PREVIEW_LENGTH]}...")
             print(f"{Fore.CYAN}[*] Getting AI answers...")
-            answers = retry(lambda: get_answers_from_models(full_content), err_msg="[!] AI answer fetch failed")
-            ai_answer = verify_and_select_answer(answers)
+            ai_answer, from_cache = get_answer()
             if not ai_answer:
                 print(f"{Fore.RED}[!] No consensus reached")
                 stats["questions_failed"] += 1
-                return
+                return "stop"
             # Try Yaklass text field first
             answer_field, field_type = None, None
             try:
-                answer_field, field_type = retry(lambda: find_answer_field(), err_msg="[!] Could not find answer field")
+                answer_field, field_type = retry(lambda: prefetched_answer_field(prefetches.get("field"), platform), err_msg="[!] Could not find answer field")
             except Exception as e:
                 answer_field, field_type = None, None
             if field_type == "text" and answer_field:
                 print(f"{Fore.GREEN}[Yaklass] Хамгийн сайн таарсан хариулт: {Fore.YELLOW}{ai_answer}")
                 retry(lambda: answer_field.click(), err_msg="[!] Could not click answer field")
-                time.sleep(0.2)
+                wait_until_focused(answer_field, 0.2)
                 human_type(answer_field, ai_answer)
                 print(f"{Fore.GREEN}[+] Typed: '{ai_answer}'")
             else:
                 # Try Yaklass multiple choice (checkbox/radio)
                 print(f"{Fore.YELLOW}[Yaklass] No text field, trying multiple choice options...")
-                options = []
-                # Checkbox
-                checkbox_lis = question_element.find_elements(By.CSS_SELECTOR, ".gxs-answer-select li")
-                for li in checkbox_lis:
-                    try:
-                        inp = li.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
-                        label = li.find_element(By.CSS_SELECTOR, "label .select-text")
-                        label_text = label.text.strip()
-                        options.append({"element": inp, "text": label_text, "type": "checkbox"})
-                    except Exception:
-                        pass
-                # Radio
-                radio_lis = question_element.find_elements(By.CSS_SELECTOR, ".gxs-answer-select li")
-                for li in radio_lis:
-                    try:
-                        inp = li.find_element(By.CSS_SELECTOR, "input[type='radio']")
-                        label = li.find_element(By.CSS_SELECTOR, "label .select-text")
-                        label_text = label.text.strip()
-                        options.append({"element": inp, "text": label_text, "type": "radio"})
-                    except Exception:
-                        pass
+                try:
+                    options = read_yaklass_choice_options(question_element)
+                except WebDriverException:
+                    options = []
                 if not options:
                     print(f"{Fore.RED}[Yaklass] No multiple choice options found!")
                     stats["questions_failed"] += 1
-                    return
+                    return "stop"
                 print(f"{Fore.CYAN}[*] Сонголтууд:")
                 for idx, opt in enumerate(options):
                     print(f"  {idx+1}. {opt['text']}")
                 print(f"{Fore.GREEN}[Yaklass] Хамгийн сайн таарсан сонголт: {Fore.YELLOW}{ai_answer}")
-                match = match_answer_to_option(ai_answer, options)
+                ai_answer, match = match_with_fresh_answer(ai_answer, from_cache, options)
                 if match:
                     print(f"{Fore.GREEN}[Yaklass] Сонгож байна: {match['option']['text']}")
                     select_answer_option(match)
                 else:
                     print(f"{Fore.RED}[Yaklass] No matching option found for answer: {ai_answer}")
                     stats["questions_failed"] += 1
-                    return
+                    return "stop"
         print(f"{Fore.CYAN}[*] Submitting answer...")
-        time.sleep(PAGE_LOAD_DELAY)
-        submit_button = retry(lambda: find_submit_button(), err_msg="[!] Submit button not found")
+        submit_button = retry(lambda: prefetched_submit_button(prefetches.get("submit"), platform), err_msg="[!] Submit button not found")
         if submit_button:
+            wait_for(EC.element_to_be_clickable(submit_button), PAGE_LOAD_DELAY)
             retry(lambda: submit_button.click(), err_msg="[!] Could not click submit button")
+            submitted_at = time.monotonic()
             print(f"{Fore.GREEN}[✓] Submitted!")
-            time.sleep(SUBMIT_WAIT_TIME)
-            try:
-                now = datetime.now()
-                elapsed = time.time() - question_start_time
-                log_path = LOG_DIR / f"success_{now.strftime('%Y%m%d_%H%M%S')}.json"
-                with open(log_path, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'question_num': q_num,
-                        'platform': platform,
-                        'question': full_content[:MAX_LOGGED_CONTENT_LENGTH],
-                        'answer': ai_answer,
-                        'time_taken': round(elapsed, 2),
-                        'timestamp': now.isoformat()
-                    }, f, ensure_ascii=False, indent=2)
-            except Exception as log_err:
-                print(f"{Fore.YELLOW}[!] Logging failed: {str(log_err)[:60]}")
+            # Done once the page has reacted: the button is gone, hidden or replaced
+            wait_for(EC.invisibility_of_element(submit_button), SUBMIT_WAIT_TIME)
+            log_success({
+                'question_num': q_num,
+                'platform': platform,
+                'question': full_content[:MAX_LOGGED_CONTENT_LENGTH],
+                'answer': ai_answer,
+                'time_taken': round(time.monotonic() - question_start_time, 2),
+                'timestamp': question_started_at
+            })
         else:
             print(f"{Fore.YELLOW}[!] Submit button not found")
             stats["questions_failed"] += 1
-            return
+            return "stop"
         print(f"{Fore.CYAN}[*] Looking for next question...")
-        time.sleep(NAVIGATION_WAIT_TIME)
-        next_button = retry(lambda: find_next_button(), err_msg="[!] Next button not found", retries=2)
+        # A full-page submit hides the button almost at once: let the new page
+        # load, then poll until NEXT_BUTTON_WAIT_TIME after the click at least
+        wait_for(page_ready, NEXT_PAGE_WAIT_TIME)
+        next_timeout = max(submitted_at + NEXT_BUTTON_WAIT_TIME - time.monotonic(), NAVIGATION_WAIT_TIME * 2)
+        next_button = wait_for(lambda d: find_next_button(platform), next_timeout, BUTTON_POLL_INTERVAL)
         if next_button:
             print(f"{Fore.YELLOW}[→] Moving to next question...")
-            time.sleep(NAVIGATION_WAIT_TIME)
             retry(lambda: next_button.click(), err_msg="[!] Could not click next button")
-            time.sleep(NEXT_PAGE_WAIT_TIME)
-            solve_task()
-        else:
-            elapsed = time.time() - stats["start_time"]
-            print(f"\n{Fore.GREEN}{'='*60}")
-            print(f"{Fore.GREEN}[✓] TEST COMPLETED!")
-            print(f"{Fore.CYAN}    Platform: {platform.upper()}")
-            print(f"{Fore.CYAN}    Total Solved: {stats['questions_solved']}")
-            print(f"{Fore.CYAN}    Total Failed: {stats['questions_failed']}")
-            print(f"{Fore.CYAN}    Time Elapsed: {int(elapsed)}s")
-            print(f"{Fore.GREEN}{'='*60}\n")
+            wait_for_navigation(next_button)
+            return "next"
     except Exception as e:
         error_log.append(f"Solve error: {str(e)[:MAX_ERROR_MSG_LENGTH]}")
         print(f"{Fore.RED}[!] Unexpected error: {str(e)[:80]}")
         stats["questions_failed"] += 1
-        time.sleep(NAVIGATION_WAIT_TIME)
-        next_button = find_next_button()
-        
-        if next_button:
-            print(f"{Fore.YELLOW}[→] Moving to next question...")
-            time.sleep(NAVIGATION_WAIT_TIME)
-            next_button.click()
-            time.sleep(NEXT_PAGE_WAIT_TIME)
-            # RECURSIVE: Automatically solve next question
-            solve_task()
-        else:
-            elapsed = time.time() - stats["start_time"]
-            print(f"\n{Fore.GREEN}{'='*50}")
-            print(f"{Fore.GREEN}[✓] Test completed!")
-            print(f"{Fore.CYAN}    Platform: {platform.upper()}")
-            print(f"{Fore.CYAN}    Solved: {stats['questions_solved']}")
-            print(f"{Fore.CYAN}    Failed: {stats['questions_failed']}")
-            print(f"{Fore.CYAN}    Time: {int(elapsed)}s")
-            print(f"{Fore.GREEN}{'='*50}\n")
-    
-    except Exception as e:
-        error_log.append(f"Navigation: {str(e)[:MAX_ERROR_MSG_LENGTH]}")
-        print(f"{Fore.YELLOW}[!] Navigation error: {str(e)[:60]}")
+        try:
+            next_button = wait_for(lambda d: find_next_button(platform), NAVIGATION_WAIT_TIME, BUTTON_POLL_INTERVAL)
+            if next_button:
+                print(f"{Fore.YELLOW}[→] Moving to next question...")
+                next_button.click()
+                wait_for_navigation(next_button)
+                return "next"
+        except Exception as e:
+            error_log.append(f"Navigation: {str(e)[:MAX_ERROR_MSG_LENGTH]}")
+            print(f"{Fore.YELLOW}[!] Navigation error: {str(e)[:60]}")
+            return "stop"
+    
+    elapsed = time.monotonic() - stats["start_time"]
+    print("\n".join([
+        f"\n{Fore.GREEN}{'='*60}",
+        f"{Fore.GREEN}[✓] TEST COMPLETED!",
+        f"{Fore.CYAN}    Platform: {platform.upper()}",
+        f"{Fore.CYAN}    Total Solved: {stats['questions_solved']}",
+        f"{Fore.CYAN}    Total Failed: {stats['questions_failed']}",
+        f"{Fore.CYAN}    Time Elapsed: {int(elapsed)}s",
+        f"{Fore.GREEN}{'='*60}\n",
+    ]))
+    return "done"
+
+def solve_task():
+    """Solve questions one after another until the test ends or a question fails."""
+    warm_up_connections()
+    # A run stays inside one test, so the platform is detected only once;
+    # each question still checks that the driver session is alive
+    get_driver()
+    platform = detect_platform()
+    while solve_current_question(platform) == "next":
+        pass
 
 print(f"{Fore.MAGENTA}=============================================")
 print(f"{Fore.MAGENTA}   MULTI-PLATFORM HOMEWORK SOLVER BOT 🚀")
@@ -2076,9 +2688,18 @@ print(f"{Fore.CYAN}Repo: created-by-Dye")
 # Discover all working models on startup
 print(f"\n{Fore.MAGENTA}[*] Initializing bot...")
 discover_and_validate_models()
+finish_connecting_driver()
+
+# Shared pool for AI queries, reused across questions
+AI_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=max(4, len(WORKING_MODELS)), thread_name_prefix="ai")
+# Connection warm-ups at the start of a run, kept apart from AI_EXECUTOR
+WARM_UP_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=WARM_UP_WORKERS, thread_name_prefix="warm-up")
+# Page lookups that overlap with the model queries; the main thread waits for
+# them before its next driver call, so the session is never used concurrently
+PREFETCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
 
 # Initialize statistics at startup
-stats["start_time"] = time.time()
+stats["start_time"] = time.monotonic()
 
 print(f"\n{Fore.GREEN}{'='*50}")
 print(f"{Fore.GREEN}[+] Bot is ready to solve!")
@@ -2093,18 +2714,50 @@ def cleanup():
     """Gracefully shutdown the bot."""
     try:
         print(f"\n{Fore.YELLOW}[*] Shutting down gracefully...")
+        # Only stop our chromedriver: the debug Chrome (and its logged-in
+        # profile) belongs to the user and stays open for the next run
         if driver:
-            driver.quit()
+            driver.service.stop()
         print(f"{Fore.GREEN}[+] Goodbye! 👋\n")
     except Exception as e:
         print(f"{Fore.RED}[!] Error during shutdown: {str(e)[:60]}")
 
 import atexit
 atexit.register(cleanup)
-
-keyboard.add_hotkey(HOTKEY, solve_task)
-keyboard.add_hotkey("ctrl+d", run_diagnostics)
-keyboard.add_hotkey("ctrl+e", interactive_element_selector)
+atexit.register(save_answer_cache)
+atexit.register(close_success_log)
+atexit.register(AI_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+atexit.register(WARM_UP_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+atexit.register(PREFETCH_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+atexit.register(perplexity_client.close)
+atexit.register(groq_client.close)
+
+# Hotkey work runs on one worker thread, not on keyboard's hook thread, so
+# key handling never waits on Selenium and jobs never overlap on the driver
+_hotkey_jobs = queue.Queue(maxsize=1)
+
+def hotkey_worker():
+    while True:
+        job = _hotkey_jobs.get()
+        try:
+            job()
+        except Exception as e:
+            print(f"{Fore.RED}[!] {job.__name__} failed: {str(e)[:80]}")
+        finally:
+            _hotkey_jobs.task_done()
+
+threading.Thread(target=hotkey_worker, name="hotkeys", daemon=True).start()
+
+def post_hotkey_job(job):
+    """Queue a hotkey's job; presses while another job is queued or running are dropped."""
+    if _hotkey_jobs.unfinished_tasks:
+        print(f"{Fore.YELLOW}[!] Still busy, ignoring key press")
+        return
+    _hotkey_jobs.put_nowait(job)
+
+keyboard.add_hotkey(HOTKEY, post_hotkey_job, args=(solve_task,))
+keyboard.add_hotkey("ctrl+d", post_hotkey_job, args=(run_diagnostics,))
+keyboard.add_hotkey("ctrl+e", post_hotkey_job, args=(interactive_element_selector,))
 
 try:
     keyboard.wait()
@@ -0,0 +1,66 @@
+import pytest
+
+from arithmetic import MAX_EXPRESSION_LENGTH, solve_arithmetic
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("47 · 38 =", "1786"),
+    ("47 × 38 = ?", "1786"),
+    ("12 ÷ 4", "3"),
+    ("(2 + 3) * 4", "20"),
+    ("-5 + 2 =", "-3"),
+    ("7/2", "3.5"),
+    ("7,5 + 1", "8,5"),
+    ("1/3 =", "0.333333"),
+    ("2020 - 2021", "-1"),
+    ("12:4 =", "3"),
+])
+def test_evaluates_arithmetic(question, expected):
+    assert solve_arithmetic(question) == expected
+
+
+def test_decimal_comma_on_request():
+    assert solve_arithmetic("7/2", decimal_comma=True) == "3,5"
+    assert solve_arithmetic("6/2", decimal_comma=True) == "3"
+
+
+@pytest.mark.parametrize("question", [
+    "2020-2021",
+    "8-800-555-35-35",
+    "12:4",
+    "12:30",
+    "1,000 + 2",
+    "1.000 + 2",
+    "42",
+    "-5",
+    "42 =",
+    "Сколько будет 2 + 2?",
+    "",
+])
+def test_rejects_ambiguous_or_non_arithmetic(question):
+    assert solve_arithmetic(question) is None
+
+
+@pytest.mark.parametrize("question", [
+    "5 / 0",
+    "5 / (2 - 2) =",
+    "2 ** 3",
+    "(1, 2) + 3",
+])
+def test_rejects_invalid_expressions(question):
+    assert solve_arithmetic(question) is None
+
+
+def test_large_integers():
+    big = "9" * 30
+    assert solve_arithmetic(f"{big} * {big} =") == str(int(big) ** 2)
+    # Too large to divide as a float
+    assert solve_arithmetic(f"{'9' * 90} * {'9' * 90} * {'9' * 90} * {'9' * 90} / 3") is None
+
+
+def test_long_input_is_rejected():
+    assert solve_arithmetic(" + ".join(["1"] * MAX_EXPRESSION_LENGTH)) is None
+
+
+def test_nested_parentheses_within_length_limit():
+    assert solve_arithmetic("(" * 90 + "1" + ")" * 90 + " + 1") == "2"